@@ -1,14 +1,419 @@
 import pandas as pd
 import numpy as np
 import json
-from typing import List, Dict, Tuple, Any
+import bisect
+import copy
+import functools
+import itertools
+from typing import List, Dict, Tuple, Any, FrozenSet
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import re
-from textblob import TextBlob
+from textblob.en import sentiment as pattern_sentiment
+from ranking import top_n_indices
 import warnings
 warnings.filterwarnings('ignore')
 
+# Explicit column dtypes: skip type inference on load and store the
+# low-cardinality string columns as categoricals
+CAREER_SKILLS_DTYPES = {
+    'career': 'category',
+    'skill': 'string',
+    'difficulty': 'category',
+    'importance': 'int64',
+    'is_required': 'bool',
+    'category': 'category',
+    'weight': 'float64'
+}
+
+COURSES_DTYPES = {
+    'title': 'string',
+    'skill': 'string',
+    'level': 'category',
+    'platform': 'category',
+    'duration_hours': 'int64',
+    'rating': 'float64',
+    'price': 'float64',
+    'students_enrolled': 'int64',
+    'instructor': 'category',
+    'last_updated': 'string',
+    'certificate': 'bool',
+    'url': 'string'
+}
+
+# Low-cardinality string columns of the remaining datasets; other columns are inferred
+JOB_POSTS_DTYPES = {
+    'company': 'category',
+    'location': 'category',
+    'experience_level': 'category',
+    'job_type': 'category'
+}
+
+PEER_PROFILES_DTYPES = {
+    'career': 'category',
+    'education': 'category',
+    'location': 'category',
+    'company_size': 'category'
+}
+
+CAREER_KEYWORDS_DTYPES = {
+    'career': 'category',
+    'category': 'category'
+}
+
+
+# Soft skills added to each career's requirements, stored column-wise
+SOFT_SKILLS_MAPPING = {
+    'Data Scientist': {
+        'skill': ['Communication', 'Problem Solving', 'Critical Thinking', 'Teamwork', 'Leadership'],
+        'difficulty': ['Intermediate', 'Intermediate', 'Intermediate', 'Intermediate', 'Intermediate'],
+        'importance': [8, 9, 8, 7, 6],
+        'is_required': [True, True, True, False, False],
+        'category': ['soft', 'soft', 'soft', 'soft', 'soft'],
+        'weight': [0.8, 0.9, 0.8, 0.7, 0.6]
+    },
+    'Data Engineer': {
+        'skill': ['Communication', 'Problem Solving', 'Attention to Detail', 'Teamwork'],
+        'difficulty': ['Intermediate', 'Advanced', 'Advanced', 'Intermediate'],
+        'importance': [7, 8, 9, 6],
+        'is_required': [True, True, True, False],
+        'category': ['soft', 'soft', 'soft', 'soft'],
+        'weight': [0.7, 0.8, 0.9, 0.6]
+    },
+    'Machine Learning Engineer': {
+        'skill': ['Communication', 'Problem Solving', 'Research Skills', 'Creativity'],
+        'difficulty': ['Intermediate', 'Advanced', 'Advanced', 'Intermediate'],
+        'importance': [7, 9, 8, 6],
+        'is_required': [True, True, True, False],
+        'category': ['soft', 'soft', 'soft', 'soft'],
+        'weight': [0.7, 0.9, 0.8, 0.6]
+    },
+    'Software Engineer': {
+        'skill': ['Communication', 'Problem Solving', 'Teamwork', 'Time Management'],
+        'difficulty': ['Intermediate', 'Advanced', 'Intermediate', 'Intermediate'],
+        'importance': [8, 9, 7, 6],
+        'is_required': [True, True, True, False],
+        'category': ['soft', 'soft', 'soft', 'soft'],
+        'weight': [0.8, 0.9, 0.7, 0.6]
+    },
+    'Frontend Developer': {
+        'skill': ['Communication', 'Problem Solving', 'Creativity', 'User Empathy'],
+        'difficulty': ['Intermediate', 'Intermediate', 'Intermediate', 'Intermediate'],
+        'importance': [8, 7, 7, 6],
+        'is_required': [True, True, False, False],
+        'category': ['soft', 'soft', 'soft', 'soft'],
+        'weight': [0.8, 0.7, 0.7, 0.6]
+    },
+    'Backend Developer': {
+        'skill': ['Communication', 'Problem Solving', 'System Thinking'],
+        'difficulty': ['Intermediate', 'Advanced', 'Advanced'],
+        'importance': [7, 8, 7],
+        'is_required': [True, True, False],
+        'category': ['soft', 'soft', 'soft'],
+        'weight': [0.7, 0.8, 0.7]
+    },
+    'DevOps Engineer': {
+        'skill': ['Communication', 'Problem Solving', 'Incident Response'],
+        'difficulty': ['Intermediate', 'Advanced', 'Advanced'],
+        'importance': [7, 8, 7],
+        'is_required': [True, True, False],
+        'category': ['soft', 'soft', 'soft'],
+        'weight': [0.7, 0.8, 0.7]
+    },
+    'Product Manager': {
+        'skill': ['Communication', 'Leadership', 'Problem Solving', 'Strategic Thinking'],
+        'difficulty': ['Advanced', 'Advanced', 'Advanced', 'Advanced'],
+        'importance': [10, 9, 9, 8],
+        'is_required': [True, True, True, True],
+        'category': ['soft', 'soft', 'soft', 'soft'],
+        'weight': [1.0, 0.9, 0.9, 0.8]
+    }
+}
+
+# Soft skills for careers without a specific entry
+DEFAULT_SOFT_SKILLS = {
+    'skill': ['Communication', 'Problem Solving', 'Teamwork', 'Leadership', 'Critical Thinking'],
+    'difficulty': ['Intermediate', 'Intermediate', 'Intermediate', 'Intermediate', 'Intermediate'],
+    'importance': [8, 9, 7, 6, 8],
+    'is_required': [True, True, False, False, True],
+    'category': ['soft', 'soft', 'soft', 'soft', 'soft'],
+    'weight': [0.8, 0.9, 0.7, 0.6, 0.8]
+}
+
+def _soft_skills_frame(soft_skills: Dict[str, List[Any]]) -> pd.DataFrame:
+    """Build a soft-skills DataFrame with compact dtypes"""
+    return pd.DataFrame(soft_skills).astype({'importance': 'int8', 'is_required': 'bool'})
+
+
+# Soft-skill DataFrames are static, so build them once at import
+_SOFT_SKILLS_DF_CACHE = {career: _soft_skills_frame(skills) for career, skills in SOFT_SKILLS_MAPPING.items()}
+_DEFAULT_SOFT_SKILLS_DF = _soft_skills_frame(DEFAULT_SOFT_SKILLS)
+
+
+# Default skill levels used when the user does not state one, grouped by skill type.
+# Groups are listed in precedence order: the first group naming a skill wins.
+_SKILL_LEVEL_GROUPS = [
+    # Core programming languages - typically require intermediate+ level
+    {skill: 'Intermediate' for skill in ['python', 'java', 'javascript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin', 'sql', 'r']},
+    # Core data science libraries - typically require intermediate level
+    {skill: 'Intermediate' for skill in ['numpy', 'pandas', 'seaborn', 'matplotlib', 'scikit-learn', 'sklearn']},
+    # Advanced frameworks and tools - typically require advanced level
+    {skill: 'Advanced' for skill in ['tensorflow', 'pytorch', 'kubernetes', 'docker', 'spark', 'hadoop', 'kafka',
+                                     'elasticsearch', 'deep learning', 'neural networks']},
+    # Basic tools and utilities - typically beginner level
+    {skill: 'Beginner' for skill in ['git', 'jupyter', 'excel', 'powerpoint', 'word', 'data visualization', 'data cleaning']},
+    # Data science and ML concepts - vary by complexity
+    {
+        'machine learning': 'Intermediate',
+        'statistics': 'Intermediate',
+        'feature engineering': 'Intermediate',
+        'model evaluation': 'Intermediate',
+        'a/b testing': 'Intermediate',
+        'business intelligence': 'Beginner'
+    },
+    # Web development frameworks
+    {
+        'react': 'Intermediate',
+        'angular': 'Advanced',
+        'vue.js': 'Intermediate',
+        'node.js': 'Intermediate',
+        'django': 'Intermediate',
+        'flask': 'Beginner',
+        'spring boot': 'Advanced',
+        'express.js': 'Beginner'
+    },
+    # Cloud platforms
+    {skill: 'Intermediate' for skill in ['aws', 'azure', 'gcp', 'heroku', 'digitalocean']},
+    # Soft skills - typically intermediate level
+    {skill: 'Intermediate' for skill in ['communication', 'leadership', 'teamwork', 'problem solving', 'critical thinking', 'creativity']}
+]
+
+# Flattened lowercase skill -> level lookup
+_SKILL_LEVEL_LOOKUP = {}
+for _level_group in _SKILL_LEVEL_GROUPS:
+    for _skill, _level in _level_group.items():
+        _SKILL_LEVEL_LOOKUP.setdefault(_skill, _level)
+
+# Core skills moved to the front of a career's learning path
+_CAREER_CORE_SKILLS = {
+    'Data Scientist': frozenset([
+        'Python', 'SQL', 'Statistics', 'Machine Learning', 'Data Cleaning',
+        'Scikit-learn', 'Model Evaluation', 'Feature Engineering'
+    ])
+}
+
+# Empty row-position array for index lookups that find nothing
+_NO_POSITIONS = np.array([], dtype=np.intp)
+
+# Set-bit count of every byte value, for popcounts where np.bitwise_count is unavailable
+_POPCOUNT_8 = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1, dtype=np.uint8)
+
+
+def _pack_bit_words(mask: np.ndarray) -> np.ndarray:
+    """Pack a boolean array's last axis into uint64 words, zero-padded to whole words"""
+    pad_width = [(0, 0)] * (mask.ndim - 1) + [(0, -mask.shape[-1] % 64)]
+    return np.packbits(np.pad(mask, pad_width), axis=-1).view(np.uint64)
+
+
+def _popcount_rows(words: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a 2-D uint64 word array"""
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0: hardware popcount per word
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return _POPCOUNT_8[words.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+# Text cleaning patterns, compiled once
+_NON_WORD_RE = re.compile(r'[^\w\s]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Demand and growth bands: a value at or above the i-th threshold falls in band i + 1
+_DEMAND_THRESHOLDS = (50, 70, 85)
+_DEMAND_STATUSES = (
+    {'level': 'Lower', 'description': 'Competitive market, focus on differentiation'},
+    {'level': 'Moderate', 'description': 'Stable job market with steady demand'},
+    {'level': 'High', 'description': 'Strong job market with good opportunities'},
+    {'level': 'Very High', 'description': 'Excellent job prospects with high demand'}
+)
+
+_GROWTH_THRESHOLDS = (5, 10, 20)
+_GROWTH_TRENDS = (
+    ('📉 Slow Growth', 'Slow growth field with {growth_rate}% annual growth'),
+    ('➡️ Stable', 'Stable field with {growth_rate}% annual growth'),
+    ('📈 Steady Growth', 'Growing field with {growth_rate}% annual growth'),
+    ('📈 Rapid Growth', 'Fast-growing field with {growth_rate}% annual growth')
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _text_polarity(text: str) -> float:
+    """Polarity from TextBlob's pattern lexicon scorer, without building a TextBlob"""
+    return pattern_sentiment(text)[0]
+
+
+def _score_careers(match_mask: np.ndarray, weights: np.ndarray, required: np.ndarray,
+                   semantic_sims: np.ndarray, n_skills: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Score every career at once from padded (n_careers, max_skills) skill matrices
+    
+    Args:
+        match_mask: Boolean matrix, True where the user has the career skill
+        weights: Skill weights (0-1), zero in padding slots
+        required: Required-skill flags, False in padding slots
+        semantic_sims: TF-IDF cosine similarity per career
+        n_skills: Number of skills listed for each career
+        
+    Returns:
+        Per-career arrays (final, base, bonus, weighted_pct, required_pct, required_matches,
+        exact_matches, capped), where capped marks final scores set by a cap or safety check
+    """
+    weighted_scores = weights * 10  # Scale to 0-10
+    total_possible_weighted_score = weighted_scores.sum(axis=1)
+    total_weighted_score = np.where(match_mask, weighted_scores, 0).sum(axis=1)
+    
+    total_required = required.sum(axis=1)
+    required_matches = (match_mask & required).sum(axis=1)
+    exact_matches = match_mask.sum(axis=1)
+    
+    weighted_pct = np.divide(total_weighted_score * 100, total_possible_weighted_score,
+                             out=np.zeros(len(weights)), where=total_possible_weighted_score > 0)
+    required_pct = np.divide(required_matches * 100, total_required,
+                             out=np.zeros(len(weights)), where=total_required > 0)
+    
+    # WEIGHTED SCORING ALGORITHM
+    # Base score: 60% weighted skills + 25% required skills + 15% semantic
+    base_score = (weighted_pct * 0.6) + (required_pct * 0.25) + (semantic_sims * 100 * 0.15)
+    
+    # BONUS SCORING - Reward good skill coverage
+    # Bonus for having most required skills: excellent / good / decent coverage
+    coverage_bonus = np.select([required_pct >= 80, required_pct >= 60, required_pct >= 40], [15, 10, 5], 0)
+    bonus_score = np.where(required_matches > 0, coverage_bonus, 0)
+    # Bonus for having complementary skills
+    bonus_score = bonus_score + np.where(exact_matches >= required_matches * 0.5, 5, 0)
+    # Bonus for high semantic similarity
+    bonus_score = bonus_score + np.where(semantic_sims > 0.3, 5, 0)
+    
+    final_score = np.minimum(100, base_score + bonus_score)
+    capped = base_score + bonus_score >= 100
+    
+    # SAFETY CHECKS - Prevent unrealistic scores
+    check = (n_skills < 8) & (final_score > 75)
+    final_score, capped = np.where(check, 75, final_score), capped | check
+    check = (final_score > 90) & (required_pct < 80)
+    final_score, capped = np.where(check, 85, final_score), capped | check
+    check = (final_score > 70) & (required_pct < 60)
+    final_score, capped = np.where(check, 65, final_score), capped | check
+    
+    return final_score, base_score, bonus_score, weighted_pct, required_pct, required_matches, exact_matches, capped
+
+
+# Peer profiles included in a peer_benchmarking result
+PEER_PROFILES_SHOWN = 5
+
+# Skill synonym groups: canonical skill -> names that mean the same thing
+_SKILL_SYNONYMS: Dict[str, Tuple[str, ...]] = {
+    # Programming Languages
+    "python": ("python", "py", "python3", "python3.8", "python3.9", "python3.10"),
+    "sql": ("sql", "mysql", "postgresql", "sqlite", "tsql", "plsql", "database", "db", "rdbms"),
+    "java": ("java", "jdk", "jvm", "spring", "maven", "gradle"),
+    "javascript": ("javascript", "js", "ecmascript", "es6", "es2015", "es2017", "es2020"),
+    "c++": ("c++", "cpp", "c plus plus", "stl", "boost"),
+    "c#": ("c#", "csharp", "dotnet", ".net", "asp.net", "entity framework"),
+    
+    # Data Science & ML
+    "machine learning": ("machine learning", "ml", "ai", "artificial intelligence", "deep learning", "neural networks", "predictive modeling"),
+    "deep learning": ("deep learning", "neural networks", "cnn", "rnn", "lstm", "transformer", "bert", "gpt"),
+    "data science": ("data science", "data scientist", "analytics", "predictive analytics"),
+    "statistics": ("statistics", "stats", "statistical analysis", "hypothesis testing", "regression", "correlation", "anova"),
+    
+    # Data Visualization & Tools
+    "data visualization": ("data visualization", "visualization", "viz", "matplotlib", "seaborn", "plotly", "tableau", "powerbi", "d3.js", "ggplot"),
+    "visualization": ("visualization", "data visualization", "viz", "charts", "graphs", "dashboards", "data viz"),
+    "pandas": ("pandas", "pd", "dataframe", "data manipulation", "data analysis"),
+    "numpy": ("numpy", "np", "numerical computing", "arrays", "matrices"),
+    "scikit-learn": ("scikit-learn", "sklearn", "machine learning library", "ml library", "scikit"),
+    
+    # ML/AI Frameworks
+    "tensorflow": ("tensorflow", "tf", "deep learning framework", "neural networks", "keras"),
+    "pytorch": ("pytorch", "torch", "deep learning", "ml framework", "neural networks"),
+    "keras": ("keras", "deep learning", "neural networks", "tensorflow"),
+    
+    # Web Development
+    "react": ("react", "reactjs", "react.js", "jsx", "hooks", "redux", "context"),
+    "angular": ("angular", "angularjs", "ng", "angular 2+", "angular material"),
+    "vue.js": ("vue", "vue.js", "vuejs", "vue 3", "composition api"),
+    "node.js": ("node.js", "nodejs", "node", "express", "npm", "yarn"),
+    "html": ("html", "html5", "markup", "semantic html", "accessibility"),
+    "css": ("css", "css3", "styling", "responsive design", "flexbox", "grid", "sass", "less"),
+    "typescript": ("typescript", "ts", "typed javascript", "type safety"),
+    
+    # Python Web Frameworks
+    "flask": ("flask", "python web framework", "microframework", "wsgi"),
+    "django": ("django", "python web framework", "mvt", "admin panel", "orm"),
+    "fastapi": ("fastapi", "python web framework", "async", "api", "pydantic"),
+    
+    # Java Frameworks
+    "spring boot": ("spring boot", "spring", "java framework", "dependency injection", "aop"),
+    "spring": ("spring", "spring framework", "spring boot", "java framework"),
+    
+    # DevOps & Cloud
+    "docker": ("docker", "containerization", "containers", "dockerfile", "docker compose"),
+    "kubernetes": ("kubernetes", "k8s", "container orchestration", "microservices", "deployment"),
+    "aws": ("aws", "amazon web services", "ec2", "s3", "lambda", "rds", "cloudfront", "route53"),
+    "azure": ("azure", "microsoft azure", "cloud computing", "vm", "blob storage", "functions"),
+    "gcp": ("gcp", "google cloud platform", "google cloud", "compute engine", "cloud storage"),
+    
+    # Big Data
+    "hadoop": ("hadoop", "apache hadoop", "big data", "mapreduce", "hdfs", "yarn"),
+    "spark": ("spark", "apache spark", "big data", "distributed computing", "dataframes", "streaming"),
+    "kafka": ("kafka", "apache kafka", "streaming", "message queue", "event streaming"),
+    
+    # Databases
+    "mongodb": ("mongodb", "nosql", "document database", "mongo", "aggregation"),
+    "postgresql": ("postgresql", "postgres", "relational database", "rdbms", "acid"),
+    "mysql": ("mysql", "relational database", "rdbms", "maria db", "innodb"),
+    "redis": ("redis", "in-memory database", "cache", "key-value store", "data structures"),
+    
+    # Infrastructure & Tools
+    "terraform": ("terraform", "infrastructure as code", "iac", "hashicorp", "provisioning"),
+    "jenkins": ("jenkins", "ci/cd", "continuous integration", "automation", "pipeline"),
+    "git": ("git", "github", "gitlab", "version control", "vcs", "source control"),
+    "linux": ("linux", "unix", "ubuntu", "centos", "debian", "red hat", "shell"),
+    
+    # Testing
+    "selenium": ("selenium", "web testing", "automated testing", "browser automation", "webdriver"),
+    "junit": ("junit", "java testing", "unit testing", "test framework", "tdd"),
+    "pytest": ("pytest", "python testing", "unit testing", "test framework", "fixtures"),
+    
+    # Design & UX
+    "figma": ("figma", "ui design", "ux design", "prototyping", "design tools", "collaboration"),
+    "adobe xd": ("adobe xd", "ux design", "prototyping", "design tools", "wireframing"),
+    "sketch": ("sketch", "ui design", "mac design tool", "prototyping", "design systems"),
+    
+    # Project Management
+    "agile": ("agile", "scrum", "kanban", "project management", "iterative", "adaptive"),
+    "scrum": ("scrum", "agile methodology", "sprint planning", "standup", "retrospective"),
+    "jira": ("jira", "project management", "issue tracking", "agile tools", "atlassian"),
+    
+    # Specialized Skills
+    "etl": ("etl", "extract transform load", "data pipeline", "data integration", "data processing"),
+    "data modeling": ("data modeling", "database design", "schema design", "normalization", "erd"),
+    "api": ("api", "rest api", "graphql", "web services", "endpoints", "microservices"),
+    "microservices": ("microservices", "microservice architecture", "distributed systems", "service mesh"),
+    "ci/cd": ("ci/cd", "continuous integration", "continuous deployment", "devops", "automation"),
+    "mlops": ("mlops", "machine learning operations", "model deployment", "model monitoring", "ml infrastructure")
+}
+
+# Lowered canonical name or synonym -> synonyms of the first group naming it
+_SYNONYM_INDEX = {}
+for _canonical_skill, _synonyms in _SKILL_SYNONYMS.items():
+    for _name in (_canonical_skill, *_synonyms):
+        _SYNONYM_INDEX.setdefault(_name.lower(), _synonyms)
+
+# Canonical names and synonyms -> groups they belong to
+_SYNONYM_PATTERN_GROUPS = {}
+for _canonical_skill, _synonyms in _SKILL_SYNONYMS.items():
+    for _pattern in (_canonical_skill, *_synonyms):
+        _SYNONYM_PATTERN_GROUPS.setdefault(_pattern, set()).add(_canonical_skill)
+
+
 class CareerRecommendationPipeline:
     def __init__(self, data_path: str = "data/"):
         """Initialize the AI pipeline with data loading and model setup"""
@@ -25,7 +430,7 @@ class CareerRecommendationPipeline:
         self._load_datasets()
         
         # Initialize models
-        self.tfidf_vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        self.tfidf_vectorizer = TfidfVectorizer(max_features=1000, stop_words='english', dtype=np.float32)
         
         # Preprocess data for faster inference
         self._preprocess_data()
@@ -33,12 +438,17 @@ class CareerRecommendationPipeline:
     def _load_datasets(self):
         """Load all required datasets"""
         try:
-            self.career_skills_df = pd.read_csv(f"{self.data_path}career_skills.csv")
+            self.career_skills_df = pd.read_csv(f"{self.data_path}career_skills.csv",
+                                                dtype=CAREER_SKILLS_DTYPES, engine='c')
             self.salary_demand_df = pd.read_csv(f"{self.data_path}salary_demand.csv")
-            self.courses_df = pd.read_csv(f"{self.data_path}courses.csv")
-            self.job_posts_df = pd.read_csv(f"{self.data_path}job_posts.csv")
-            self.peer_profiles_df = pd.read_csv(f"{self.data_path}peer_profiles.csv")
-            self.career_keywords_df = pd.read_csv(f"{self.data_path}career_keywords.csv")
+            self.courses_df = pd.read_csv(f"{self.data_path}courses.csv",
+                                          dtype=COURSES_DTYPES, engine='c')
+            self.job_posts_df = pd.read_csv(f"{self.data_path}job_posts.csv",
+                                            dtype=JOB_POSTS_DTYPES, engine='c')
+            self.peer_profiles_df = pd.read_csv(f"{self.data_path}peer_profiles.csv",
+                                                dtype=PEER_PROFILES_DTYPES, engine='c')
+            self.career_keywords_df = pd.read_csv(f"{self.data_path}career_keywords.csv",
+                                                  dtype=CAREER_KEYWORDS_DTYPES, engine='c')
             
             with open(f"{self.data_path}qa_dataset.json", 'r') as f:
                 self.qa_data = json.load(f)
@@ -53,20 +463,200 @@ class CareerRecommendationPipeline:
         # Create career-skill vectors for similarity matching
         self.career_skill_vectors = {}
         
+        # Lowered skill names per career, in career order
+        career_skill_lists = []
+        
+        # Skill rows per career, grouped in a single pass over the DataFrame
+        self._career_skill_frames = {}
+        # Structured (skill, category, weight, weighted_score, is_required) array per career
+        self._career_skill_struct = {}
+        # Explanation for a user with none of the career's skills (reused by skill_matching)
+        self._unmatched_analysis = {}
+        # Technical + soft skill requirements per career, filled lazily by gap_analysis
+        self._career_requirements = {}
+        
         # Create career profiles using TF-IDF
         career_profiles = []
-        for career in self.career_skills_df['career'].unique():
-            career_skills = self.career_skills_df[
-                self.career_skills_df['career'] == career
-            ]['skill'].tolist()
+        for career, career_rows in self.career_skills_df.groupby('career', sort=False, observed=True):
+            self._career_skill_frames[career] = career_rows
+            career_skills = career_rows['skill'].tolist()
+            
+            skill_struct = np.empty(len(career_rows), dtype=[
+                ('skill', f'U{max(len(skill) for skill in career_skills)}'),
+                ('category', 'U16'),
+                ('weight', 'f8'),
+                ('weighted_score', 'f8'),
+                ('is_required', '?')
+            ])
+            skill_struct['skill'] = career_skills
+            skill_struct['category'] = career_rows['category'].astype(str).to_numpy()
+            skill_struct['weight'] = career_rows['weight'].to_numpy(dtype=np.float64)
+            skill_struct['weighted_score'] = skill_struct['weight'] * 10  # Scale to 0-10
+            skill_struct['is_required'] = career_rows['is_required'].to_numpy(dtype=bool)
+            self._career_skill_struct[career] = skill_struct
+            self._unmatched_analysis[career] = self._calculate_weighted_matching(
+                career, np.zeros(len(career_rows), dtype=bool)
+            )
+            
+            career_skill_lists.append([skill.lower() for skill in career_skills])
             
             # Create career profile text
             career_profile = f"{career} requires skills: {', '.join(career_skills)}"
             career_profiles.append(career_profile)
             self.career_skill_vectors[career] = career_profile
         
+        # Padded (n_careers, max_skills) matrices for batch scoring
+        self._career_names = list(self.career_skill_vectors)
+        self._career_skill_counts = np.array([len(skills) for skills in career_skill_lists])
+        max_skills = int(self._career_skill_counts.max())
+        self._career_valid_mask = np.arange(max_skills) < self._career_skill_counts[:, None]
+        
+        # Intern lowered skill names to int IDs so matching is a boolean gather
+        self._skill_id = {}
+        for skills in career_skill_lists:
+            for skill in skills:
+                self._skill_id.setdefault(skill, len(self._skill_id))
+        self._career_skill_ids = np.zeros(self._career_valid_mask.shape, dtype=np.int32)
+        self._career_skill_ids[self._career_valid_mask] = [
+            self._skill_id[skill] for skills in career_skill_lists for skill in skills
+        ]
+        
+        self._career_weights = np.zeros(self._career_valid_mask.shape)
+        self._career_weights[self._career_valid_mask] = np.concatenate(
+            [self._career_skill_struct[career]['weight'] for career in self._career_names]
+        )
+        self._career_required = np.zeros(self._career_valid_mask.shape, dtype=bool)
+        self._career_required[self._career_valid_mask] = np.concatenate(
+            [self._career_skill_struct[career]['is_required'] for career in self._career_names]
+        )
+        
+        self._build_synonym_index()
+        
         # Fit TF-IDF vectorizer
         self.career_tfidf_matrix = self.tfidf_vectorizer.fit_transform(career_profiles)
+        
+        # TF-IDF rows are already L2-normalized, so cosine similarity is a plain
+        # sparse dot product against this float32 CSR matrix
+        self._career_tfidf_norm = self.career_tfidf_matrix.astype(np.float32).tocsr()
+        
+        # Prebuilt tokenizer, vocabulary and IDF weights so the user profile can be
+        # vectorized without going through TfidfVectorizer.transform on every call
+        self._tfidf_analyzer = self.tfidf_vectorizer.build_analyzer()
+        self._tfidf_vocabulary = self.tfidf_vectorizer.vocabulary_
+        self._tfidf_idf = self.tfidf_vectorizer.idf_.astype(np.float32)
+        
+        # Small corpora are scored faster as one dense GEMV than through sparse dispatch
+        self._career_tfidf_dense = None
+        n_careers, n_features = self._career_tfidf_norm.shape
+        if n_careers * n_features < 1_000_000:
+            self._career_tfidf_dense = self._career_tfidf_norm.toarray()
+        
+        # Required skills per job post, split once: original spelling and lowered set
+        self._job_required_skills = self.job_posts_df['required_skills'].str.split(',').map(
+            lambda skills: [skill.strip() for skill in skills]
+        )
+        self._job_required_skills_lower = self._job_required_skills.map(
+            lambda skills: frozenset(skill.lower() for skill in skills)
+        )
+        
+        # Course row positions per (skill, level), for learning-path course lookup
+        self._course_positions_by_skill_level = self.courses_df.groupby(
+            ['skill', 'level'], sort=False, observed=True
+        ).indices
+        
+        # Job post row positions whose title mentions each known career
+        self._job_positions_by_career = {
+            career: np.flatnonzero(
+                self.job_posts_df['title'].str.contains(career, case=False, na=False, regex=False)
+            )
+            for career in self.salary_demand_df['career'].unique()
+        }
+        
+        # Peer skills parsed once: lowered, stripped skill list per peer, plus the raw and
+        # distinct skill counts and one row per (peer position, skill) for frequency counts
+        peer_skill_lists = [
+            [skill.strip().lower() for skill in skills.split(',')] for skills in self.peer_profiles_df['skills']
+        ]
+        self._peer_skill_lists = peer_skill_lists
+        self._peer_raw_skill_counts = np.array([len(skills) for skills in peer_skill_lists], dtype=np.int64)
+        self._peer_skill_counts = np.array([len(set(skills)) for skills in peer_skill_lists], dtype=np.int64)
+        self._peer_skill_rows = pd.Series(
+            [skill for skills in peer_skill_lists for skill in skills],
+            index=np.repeat(np.arange(len(peer_skill_lists)), self._peer_raw_skill_counts),
+            dtype=object
+        )
+        
+        # Peer skill sets as packed bit rows over a shared vocabulary of lowered peer skills
+        self._peer_skill_bit = {}
+        for skills in peer_skill_lists:
+            for skill in skills:
+                self._peer_skill_bit.setdefault(skill, len(self._peer_skill_bit))
+        peer_skill_matrix = np.zeros((len(peer_skill_lists), len(self._peer_skill_bit)), dtype=bool)
+        peer_skill_matrix[
+            np.repeat(np.arange(len(peer_skill_lists)), self._peer_raw_skill_counts),
+            [self._peer_skill_bit[skill] for skills in peer_skill_lists for skill in skills]
+        ] = True
+        self._peer_skill_bits = _pack_bit_words(peer_skill_matrix)
+        
+        # Repeated chatbot questions are answered from a per-instance LRU cache
+        self._chatbot_answer = functools.lru_cache(maxsize=1024)(self._answer_question)
+        
+        # Inverted QA index: word -> [(qa_id, weight)]. Tags match whole words, so they are
+        # indexed up front; question matches are substring checks, so a word's postings are
+        # computed when it is queried and kept in a bounded per-instance LRU cache
+        self._qa_questions_lower = [qa['question'].lower() for qa in self.qa_data]
+        self._qa_tag_index = {}
+        for qa_id, qa in enumerate(self.qa_data):
+            for tag in dict.fromkeys(tag.lower() for tag in qa['tags']):
+                self._qa_tag_index.setdefault(tag, []).append(qa_id)
+        self._qa_postings = functools.lru_cache(maxsize=4096)(self._compute_qa_postings)
+        
+        # Lowered skill name -> first original spelling, for skill extraction from text
+        self._skill_lower_to_original = {}
+        for skill in self.career_skills_df['skill']:
+            self._skill_lower_to_original.setdefault(skill.lower(), skill)
+        self._all_skills_lower = set(self.career_skills_df['skill'].str.lower().tolist())
+        
+        # Lowered career keywords and their distinct values
+        self._keywords_lower = self.career_keywords_df['keyword'].str.lower()
+        self._unique_keywords_lower = self._keywords_lower.unique().tolist()
+        
+        # One alternation finds every keyword occurrence in a single regex pass. The
+        # lookahead reports the longest keyword starting at each position, so shorter
+        # keywords sharing that start are recovered through the prefix map
+        self._keyword_master_re = re.compile('(?=({}))'.format('|'.join(
+            re.escape(keyword) for keyword in sorted(self._unique_keywords_lower, key=len, reverse=True)
+        )))
+        self._keyword_prefixes = {
+            keyword: [prefix for prefix in self._unique_keywords_lower if keyword.startswith(prefix)]
+            for keyword in self._unique_keywords_lower
+        }
+        
+        # Row positions of each career's keywords, grouped once in first-appearance order
+        keyword_groups = self.career_keywords_df.groupby('career', sort=False, observed=True).indices
+        self._keyword_positions_by_career = {
+            career: keyword_groups[career] for career in self.career_keywords_df['career'].unique()
+        }
+        self._keyword_names = self.career_keywords_df['keyword'].to_numpy()
+        self._keyword_frequencies = self.career_keywords_df['frequency_percentage'].to_numpy()
+        self._keyword_importances = self.career_keywords_df['importance_score'].to_numpy()
+    
+    def _user_tfidf_vector(self, profile: str) -> np.ndarray:
+        """Dense, L2-normalized float32 TF-IDF vector for a profile string"""
+        user_vector = np.zeros(len(self._tfidf_idf), dtype=np.float32)
+        for token in self._tfidf_analyzer(profile):
+            feature_index = self._tfidf_vocabulary.get(token)
+            if feature_index is not None:
+                user_vector[feature_index] += 1
+        
+        user_vector *= self._tfidf_idf
+        user_vector /= np.linalg.norm(user_vector) + 1e-12
+        return user_vector
+    
+    def _build_synonym_index(self):
+        """Set up the per-instance cache over the module-level synonym index"""
+        # The same skill list is typically expanded several times per session
+        self._expand_skill_set = functools.lru_cache(maxsize=512)(self._expand_lowered_skills)
     
     def skill_matching(self, user_skills: List[str], top_n: int = 5) -> List[Dict[str, Any]]:
         """
@@ -83,180 +673,128 @@ class CareerRecommendationPipeline:
             return []
         
         # Normalize user skills and expand with synonyms
-        expanded_user_skills = self._expand_skills_with_synonyms(user_skills)
-        user_skill_set = set([skill.lower() for skill in expanded_user_skills])
-        
-        career_matches = []
+        user_skill_set = self._expand_skills_with_synonyms(user_skills)
         
-        for i, (career, career_profile) in enumerate(self.career_skill_vectors.items()):
-            # Get career skills with categories and weights
-            career_skills = self.career_skills_df[
-                self.career_skills_df['career'] == career
-            ]
-            
-            if career_skills.empty:
-                continue
-                
-            required_skills = career_skills[career_skills['is_required'] == True]
-            all_career_skills = career_skills
-            
-            if all_career_skills.empty:
-                continue
-                
-            # Calculate weighted skill matching
-            weighted_analysis = self._calculate_weighted_matching(
-                user_skill_set, all_career_skills, required_skills
-            )
-            
-            # Calculate semantic similarity using TF-IDF
-            user_profile = f"User has skills: {', '.join(user_skills)}"
-            user_tfidf = self.tfidf_vectorizer.transform([user_profile])
-            career_tfidf = self.career_tfidf_matrix[i:i+1]
-            semantic_similarity = cosine_similarity(user_tfidf, career_tfidf)[0][0]
-            
-            # WEIGHTED SCORING ALGORITHM
-            # Base score: 60% weighted skills + 25% required skills + 15% semantic
-            base_score = (
-                (weighted_analysis['weighted_match_percentage'] * 0.6) +    # 60% weighted skills
-                (weighted_analysis['required_match_percentage'] * 0.25) +   # 25% required skills
-                (semantic_similarity * 100 * 0.15)                         # 15% semantic similarity
+        # Semantic similarity against every career in a single sparse product
+        user_profile = f"User has skills: {', '.join(user_skills)}"
+        user_vector = self._user_tfidf_vector(user_profile)
+        if self._career_tfidf_dense is not None:
+            semantic_similarities = self._career_tfidf_dense @ user_vector
+        else:
+            semantic_similarities = self._career_tfidf_norm @ user_vector
+        
+        # Batch-score all careers over the padded skill matrices
+        has_skill = np.zeros(len(self._skill_id), dtype=bool)
+        has_skill[[self._skill_id[skill] for skill in user_skill_set if skill in self._skill_id]] = True
+        match_mask = has_skill[self._career_skill_ids] & self._career_valid_mask
+        final_scores, base_scores, bonus_scores, _, _, _, exact_matches, capped = _score_careers(
+            match_mask, self._career_weights, self._career_required,
+            semantic_similarities, self._career_skill_counts
+        )
+        
+        # Rank on the numbers alone; explanations are only built for the top N
+        match_percentages = np.array([round(float(score), 1) for score in final_scores])
+        top_indices = top_n_indices(match_percentages, top_n)
+        
+        # Capped scores are the int caps themselves, as in the original per-career loop
+        return [
+            self._build_career_match(
+                i, match_mask[i], float(semantic_similarities[i]),
+                int(final_scores[i]) if capped[i] else float(final_scores[i]),
+                float(base_scores[i]), int(bonus_scores[i]), int(exact_matches[i])
             )
-            
-            # BONUS SCORING - Reward good skill coverage
-            bonus_score = 0
-            
-            # Bonus for having most required skills
-            if weighted_analysis['required_matches']:
-                required_coverage = weighted_analysis['required_match_percentage']
-                if required_coverage >= 80:
-                    bonus_score += 15  # Excellent coverage
-                elif required_coverage >= 60:
-                    bonus_score += 10  # Good coverage
-                elif required_coverage >= 40:
-                    bonus_score += 5   # Decent coverage
-            
-            # Bonus for having complementary skills
-            if len(weighted_analysis['exact_matches']) >= len(weighted_analysis['required_matches']) * 0.5:
-                bonus_score += 5
-            
-            # Bonus for high semantic similarity
-            if semantic_similarity > 0.3:
-                bonus_score += 5
-            
-            # Calculate final score
-            final_score = min(100, base_score + bonus_score)
-            
-            # SAFETY CHECKS - Prevent unrealistic scores
-            if len(all_career_skills) < 8 and final_score > 75:
-                final_score = min(75, final_score)
-            
-            if final_score > 90 and weighted_analysis['required_match_percentage'] < 80:
-                final_score = min(85, final_score)
-            
-            if final_score > 70 and weighted_analysis['required_match_percentage'] < 60:
-                final_score = min(65, final_score)
-            
-            career_matches.append({
-                'career': career,
-                'match_percentage': round(final_score, 1),
-                'base_score': round(base_score, 1),
-                'bonus_score': round(bonus_score, 1),
-                'semantic_similarity': round(semantic_similarity, 3),
-                
-                # Weighted Analysis Results
-                'weighted_match_percentage': round(weighted_analysis['weighted_match_percentage'], 1),
-                'required_match_percentage': round(weighted_analysis['required_match_percentage'], 1),
-                'category_scores': weighted_analysis['category_scores'],
-                
-                # Skills Breakdown
-                'matched_skills': weighted_analysis['matched_skills_by_category'],
-                'missing_skills': weighted_analysis['missing_skills_by_category'],
-                'required_missing': weighted_analysis['required_missing_by_category'],
-                
-                # Summary Statistics
-                'total_career_skills': len(all_career_skills),
-                'total_required_skills': len(required_skills),
-                'skills_covered': len(weighted_analysis['exact_matches']),
-                
-                # Explainability
-                'score_breakdown': weighted_analysis['score_breakdown']
-            })
+            for i in top_indices
+        ]
+    
+    def _build_career_match(self, career_index: int, match_row: np.ndarray, semantic_similarity: float,
+                            final_score: float, base_score: float, bonus_score: int,
+                            exact_matches: int) -> Dict[str, Any]:
+        """Assemble the explainable skill_matching result for one scored career"""
+        career = self._career_names[career_index]
+        n_skills = int(self._career_skill_counts[career_index])
+        
+        # Calculate weighted skill matching (explainability); careers sharing
+        # no skills with the user reuse a precomputed breakdown
+        if exact_matches:
+            weighted_analysis = self._calculate_weighted_matching(career, match_row[:n_skills])
+        else:
+            weighted_analysis = copy.deepcopy(self._unmatched_analysis[career])
         
-        # Sort by match percentage
-        career_matches.sort(key=lambda x: x['match_percentage'], reverse=True)
-        return career_matches[:top_n]  # Return top N matches
+        return {
+            'career': career,
+            'match_percentage': round(final_score, 1),
+            'base_score': round(base_score, 1),
+            'bonus_score': round(bonus_score, 1),
+            'semantic_similarity': round(semantic_similarity, 3),
+            
+            # Weighted Analysis Results
+            'weighted_match_percentage': round(weighted_analysis['weighted_match_percentage'], 1),
+            'required_match_percentage': round(weighted_analysis['required_match_percentage'], 1),
+            'category_scores': weighted_analysis['category_scores'],
+            
+            # Skills Breakdown
+            'matched_skills': weighted_analysis['matched_skills_by_category'],
+            'missing_skills': weighted_analysis['missing_skills_by_category'],
+            'required_missing': weighted_analysis['required_missing_by_category'],
+            
+            # Summary Statistics
+            'total_career_skills': n_skills,
+            'total_required_skills': weighted_analysis['score_breakdown']['total_required'],
+            'skills_covered': len(weighted_analysis['exact_matches']),
+            
+            # Explainability
+            'score_breakdown': weighted_analysis['score_breakdown']
+        }
     
-    def _calculate_weighted_matching(self, user_skill_set: set, career_skills_df: pd.DataFrame, 
-                                   required_skills_df: pd.DataFrame) -> Dict[str, Any]:
-        """Calculate weighted skill matching with categories"""
+    def _calculate_weighted_matching(self, career: str, match_mask: np.ndarray) -> Dict[str, Any]:
+        """
+        Calculate weighted skill matching with categories
+        
+        Args:
+            career: Career name
+            match_mask: Boolean array aligned with the career's skills, True where the user has the skill
+            
+        Returns:
+            Match statistics plus per-category skill breakdowns for explainability
+        """
+        career_skills = self._career_skill_struct[career]
+        required_mask = career_skills['is_required']
         
         # Initialize category tracking
         categories = ['core', 'intermediate', 'supporting', 'soft']
         category_scores = {cat: 0.0 for cat in categories}
-        matched_skills_by_category = {cat: [] for cat in categories}
-        missing_skills_by_category = {cat: [] for cat in categories}
-        required_missing_by_category = {cat: [] for cat in categories}
+        matched_skills_by_category = {}
+        missing_skills_by_category = {}
+        required_missing_by_category = {}
+        category_totals = {}
+        
+        for category in categories:
+            in_category = career_skills['category'] == category
+            matched_skills_by_category[category] = self._skill_records(career_skills[in_category & match_mask])
+            missing_skills_by_category[category] = self._skill_records(career_skills[in_category & ~match_mask])
+            required_missing_by_category[category] = self._skill_records(
+                career_skills[in_category & ~match_mask & required_mask]
+            )
+            category_totals[category] = int(in_category.sum())
         
         # Track exact matches and required skills
-        exact_matches = set()
-        required_matches = set()
-        total_weighted_score = 0
-        total_possible_weighted_score = 0
-        
-        # Process each career skill
-        for _, skill_row in career_skills_df.iterrows():
-            skill_name = skill_row['skill'].lower()
-            skill_category = skill_row.get('category', 'intermediate')
-            skill_weight = skill_row.get('weight', 0.7)
-            is_required = skill_row.get('is_required', False)
-            
-            # Calculate weighted score for this skill
-            skill_weighted_score = skill_weight * 10  # Scale to 0-10
-            
-            if skill_name in user_skill_set:
-                # Skill matched
-                exact_matches.add(skill_name)
-                total_weighted_score += skill_weighted_score
-                matched_skills_by_category[skill_category].append({
-                    'skill': skill_row['skill'],
-                    'category': skill_category,
-                    'weight': skill_weight,
-                    'weighted_score': skill_weighted_score
-                })
-                
-                if is_required:
-                    required_matches.add(skill_name)
-            else:
-                # Skill missing
-                missing_skills_by_category[skill_category].append({
-                    'skill': skill_row['skill'],
-                    'category': skill_category,
-                    'weight': skill_weight,
-                    'weighted_score': skill_weighted_score
-                })
-                
-                if is_required:
-                    required_missing_by_category[skill_category].append({
-                        'skill': skill_row['skill'],
-                        'category': skill_category,
-                        'weight': skill_weight,
-                        'weighted_score': skill_weighted_score
-                    })
-            
-            total_possible_weighted_score += skill_weighted_score
+        exact_matches = {skill.lower() for skill in career_skills['skill'][match_mask].tolist()}
+        required_matches = {skill.lower() for skill in career_skills['skill'][match_mask & required_mask].tolist()}
+        total_weighted_score = float(career_skills['weighted_score'][match_mask].sum())
+        total_possible_weighted_score = float(career_skills['weighted_score'].sum())
+        total_required = int(required_mask.sum())
         
         # Calculate category scores
         for category in categories:
             matched_in_category = len(matched_skills_by_category[category])
-            total_in_category = len([s for _, s in career_skills_df.iterrows() 
-                                   if s.get('category', 'intermediate') == category])
+            total_in_category = category_totals[category]
             
             if total_in_category > 0:
                 category_scores[category] = (matched_in_category / total_in_category) * 100
         
         # Calculate overall percentages
         weighted_match_percentage = (total_weighted_score / total_possible_weighted_score * 100) if total_possible_weighted_score > 0 else 0
-        required_match_percentage = (len(required_matches) / len(required_skills_df) * 100) if len(required_skills_df) > 0 else 0
+        required_match_percentage = (len(required_matches) / total_required * 100) if total_required > 0 else 0
         
         # Create score breakdown for explainability
         score_breakdown = {
@@ -264,13 +802,12 @@ class CareerRecommendationPipeline:
             'total_possible_weighted_score': round(total_possible_weighted_score, 1),
             'weighted_percentage': round(weighted_match_percentage, 1),
             'required_matches': len(required_matches),
-            'total_required': len(required_skills_df),
+            'total_required': total_required,
             'required_percentage': round(required_match_percentage, 1),
             'category_breakdown': {
                 cat: {
                     'matched': len(matched_skills_by_category[cat]),
-                    'total': len([s for _, s in career_skills_df.iterrows() 
-                                if s.get('category', 'intermediate') == cat]),
+                    'total': category_totals[cat],
                     'score': round(category_scores[cat], 1)
                 } for cat in categories
             }
@@ -288,130 +825,35 @@ class CareerRecommendationPipeline:
             'score_breakdown': score_breakdown
         }
     
-    def _expand_skills_with_synonyms(self, user_skills: List[str]) -> List[str]:
-        """Expand user skills with synonyms for better matching"""
-        expanded_skills = user_skills.copy()
-        
-        # ENHANCED SKILL SYNONYMS - More comprehensive mapping
-        skill_synonyms = {
-            # Programming Languages
-            "python": ["python", "py", "python3", "python3.8", "python3.9", "python3.10"],
-            "sql": ["sql", "mysql", "postgresql", "sqlite", "tsql", "plsql", "database", "db", "rdbms"],
-            "java": ["java", "jdk", "jvm", "spring", "maven", "gradle"],
-            "javascript": ["javascript", "js", "ecmascript", "es6", "es2015", "es2017", "es2020"],
-            "c++": ["c++", "cpp", "c plus plus", "stl", "boost"],
-            "c#": ["c#", "csharp", "dotnet", ".net", "asp.net", "entity framework"],
-            
-            # Data Science & ML
-            "machine learning": ["machine learning", "ml", "ai", "artificial intelligence", "deep learning", "neural networks", "predictive modeling"],
-            "deep learning": ["deep learning", "neural networks", "cnn", "rnn", "lstm", "transformer", "bert", "gpt"],
-            "data science": ["data science", "data scientist", "analytics", "predictive analytics"],
-            "statistics": ["statistics", "stats", "statistical analysis", "hypothesis testing", "regression", "correlation", "anova"],
-            
-            # Data Visualization & Tools
-            "data visualization": ["data visualization", "visualization", "viz", "matplotlib", "seaborn", "plotly", "tableau", "powerbi", "d3.js", "ggplot"],
-            "visualization": ["visualization", "data visualization", "viz", "charts", "graphs", "dashboards", "data viz"],
-            "pandas": ["pandas", "pd", "dataframe", "data manipulation", "data analysis"],
-            "numpy": ["numpy", "np", "numerical computing", "arrays", "matrices"],
-            "scikit-learn": ["scikit-learn", "sklearn", "machine learning library", "ml library", "scikit"],
-            
-            # ML/AI Frameworks
-            "tensorflow": ["tensorflow", "tf", "deep learning framework", "neural networks", "keras"],
-            "pytorch": ["pytorch", "torch", "deep learning", "ml framework", "neural networks"],
-            "keras": ["keras", "deep learning", "neural networks", "tensorflow"],
-            
-            # Web Development
-            "react": ["react", "reactjs", "react.js", "jsx", "hooks", "redux", "context"],
-            "angular": ["angular", "angularjs", "ng", "angular 2+", "angular material"],
-            "vue.js": ["vue", "vue.js", "vuejs", "vue 3", "composition api"],
-            "node.js": ["node.js", "nodejs", "node", "express", "npm", "yarn"],
-            "html": ["html", "html5", "markup", "semantic html", "accessibility"],
-            "css": ["css", "css3", "styling", "responsive design", "flexbox", "grid", "sass", "less"],
-            "typescript": ["typescript", "ts", "typed javascript", "type safety"],
-            
-            # Python Web Frameworks
-            "flask": ["flask", "python web framework", "microframework", "wsgi"],
-            "django": ["django", "python web framework", "mvt", "admin panel", "orm"],
-            "fastapi": ["fastapi", "python web framework", "async", "api", "pydantic"],
-            
-            # Java Frameworks
-            "spring boot": ["spring boot", "spring", "java framework", "dependency injection", "aop"],
-            "spring": ["spring", "spring framework", "spring boot", "java framework"],
-            
-            # DevOps & Cloud
-            "docker": ["docker", "containerization", "containers", "dockerfile", "docker compose"],
-            "kubernetes": ["kubernetes", "k8s", "container orchestration", "microservices", "deployment"],
-            "aws": ["aws", "amazon web services", "ec2", "s3", "lambda", "rds", "cloudfront", "route53"],
-            "azure": ["azure", "microsoft azure", "cloud computing", "vm", "blob storage", "functions"],
-            "gcp": ["gcp", "google cloud platform", "google cloud", "compute engine", "cloud storage"],
-            
-            # Big Data
-            "hadoop": ["hadoop", "apache hadoop", "big data", "mapreduce", "hdfs", "yarn"],
-            "spark": ["spark", "apache spark", "big data", "distributed computing", "dataframes", "streaming"],
-            "kafka": ["kafka", "apache kafka", "streaming", "message queue", "event streaming"],
-            
-            # Databases
-            "mongodb": ["mongodb", "nosql", "document database", "mongo", "aggregation"],
-            "postgresql": ["postgresql", "postgres", "relational database", "rdbms", "acid"],
-            "mysql": ["mysql", "relational database", "rdbms", "maria db", "innodb"],
-            "redis": ["redis", "in-memory database", "cache", "key-value store", "data structures"],
-            
-            # Infrastructure & Tools
-            "terraform": ["terraform", "infrastructure as code", "iac", "hashicorp", "provisioning"],
-            "jenkins": ["jenkins", "ci/cd", "continuous integration", "automation", "pipeline"],
-            "git": ["git", "github", "gitlab", "version control", "vcs", "source control"],
-            "linux": ["linux", "unix", "ubuntu", "centos", "debian", "red hat", "shell"],
-            
-            # Testing
-            "selenium": ["selenium", "web testing", "automated testing", "browser automation", "webdriver"],
-            "junit": ["junit", "java testing", "unit testing", "test framework", "tdd"],
-            "pytest": ["pytest", "python testing", "unit testing", "test framework", "fixtures"],
-            
-            # Design & UX
-            "figma": ["figma", "ui design", "ux design", "prototyping", "design tools", "collaboration"],
-            "adobe xd": ["adobe xd", "ux design", "prototyping", "design tools", "wireframing"],
-            "sketch": ["sketch", "ui design", "mac design tool", "prototyping", "design systems"],
-            
-            # Project Management
-            "agile": ["agile", "scrum", "kanban", "project management", "iterative", "adaptive"],
-            "scrum": ["scrum", "agile methodology", "sprint planning", "standup", "retrospective"],
-            "jira": ["jira", "project management", "issue tracking", "agile tools", "atlassian"],
-            
-            # Specialized Skills
-            "etl": ["etl", "extract transform load", "data pipeline", "data integration", "data processing"],
-            "data modeling": ["data modeling", "database design", "schema design", "normalization", "erd"],
-            "api": ["api", "rest api", "graphql", "web services", "endpoints", "microservices"],
-            "microservices": ["microservices", "microservice architecture", "distributed systems", "service mesh"],
-            "ci/cd": ["ci/cd", "continuous integration", "continuous deployment", "devops", "automation"],
-            "mlops": ["mlops", "machine learning operations", "model deployment", "model monitoring", "ml infrastructure"]
-        }
-        
-        # Expand skills with synonyms
-        for skill in user_skills:
-            skill_lower = skill.lower()
-            
-            # Direct synonym lookup
-            if skill_lower in skill_synonyms:
-                for synonym in skill_synonyms[skill_lower]:
-                    if synonym not in expanded_skills:
-                        expanded_skills.append(synonym)
-            
-            # Fuzzy matching for partial matches
-            for canonical_skill, synonyms in skill_synonyms.items():
-                # Check if user skill is contained in any canonical skill
-                if skill_lower in canonical_skill or canonical_skill in skill_lower:
-                    for synonym in synonyms:
-                        if synonym not in expanded_skills:
-                            expanded_skills.append(synonym)
-                
-                # Check if user skill matches any synonym
-                for synonym in synonyms:
-                    if skill_lower in synonym or synonym in skill_lower:
-                        for all_synonyms in synonyms:
-                            if all_synonyms not in expanded_skills:
-                                expanded_skills.append(all_synonyms)
-        
-        return expanded_skills
+    @staticmethod
+    def _skill_records(career_skills: np.ndarray) -> List[Dict[str, Any]]:
+        """Materialize structured skill rows as API dicts"""
+        return [
+            {'skill': skill, 'category': category, 'weight': weight, 'weighted_score': weighted_score}
+            for skill, category, weight, weighted_score
+            in career_skills[['skill', 'category', 'weight', 'weighted_score']].tolist()
+        ]
+    
+    def _expand_skills_with_synonyms(self, user_skills: List[str]) -> FrozenSet[str]:
+        """Expand user skills with synonyms for better matching (lowercased)"""
+        return self._expand_skill_set(frozenset(skill.lower() for skill in user_skills))
+    
+    def _expand_lowered_skills(self, user_skills: FrozenSet[str]) -> FrozenSet[str]:
+        """Synonym expansion of a lowercased skill set; memoized per instance as _expand_skill_set"""
+        expanded_skills = set(user_skills)
+        
+        for skill_lower in user_skills:
+            # Groups with a name or synonym that contains, or is contained in, the user skill:
+            # two substring searches per name, so the cost stays linear in the skill length
+            matched_groups = set()
+            for pattern, groups in _SYNONYM_PATTERN_GROUPS.items():
+                if skill_lower in pattern or pattern in skill_lower:
+                    matched_groups.update(groups)
+            
+            for canonical_skill in matched_groups:
+                expanded_skills.update(_SKILL_SYNONYMS[canonical_skill])
+        
+        return frozenset(expanded_skills)
     
     def _parse_user_skills(self, user_skills_input: str) -> List[Dict[str, str]]:
         """
@@ -478,14 +920,9 @@ class CareerRecommendationPipeline:
         if target_career not in self.career_skills_df['career'].values:
             return {"error": "Career not found"}
         
-        # Get career requirements
-        career_requirements = self.career_skills_df[
-            self.career_skills_df['career'] == target_career
-        ]
-        
-        # Get soft skills for this career and add them to requirements
-        soft_skills = self._get_soft_skills_for_career(target_career)
-        career_requirements = pd.concat([career_requirements, soft_skills], ignore_index=True)
+        # Get career requirements (technical + soft skills)
+        requirements = self._get_career_requirements(target_career)
+        career_requirements = requirements['frame']
         
         # Parse user skills to extract names and levels
         if isinstance(user_skills, str):
@@ -551,8 +988,10 @@ class CareerRecommendationPipeline:
                     })
         
         # Calculate completion percentages using importance-weighted formula
+        has_mask = np.isin(requirements['skills_lower'], list(user_skill_set))
+        required_mask = requirements['required_mask']
         total_required_importance = required_skills['importance'].sum()
-        user_required_importance = sum([s['importance'] for s in user_has if s['is_required']])
+        user_required_importance = requirements['importance'][has_mask & required_mask].sum()
         
         # Main completion percentage (required skills only)
         completion_percentage = (user_required_importance / total_required_importance * 100) if total_required_importance > 0 else 0
@@ -560,8 +999,8 @@ class CareerRecommendationPipeline:
         # Separate progress tracking for required vs optional
         total_required = len(required_skills)
         total_optional = len(optional_skills)
-        required_covered = len([s for s in user_has if s['is_required']])
-        optional_covered = len([s for s in user_has if not s['is_required']])
+        required_covered = int((has_mask & required_mask).sum())
+        optional_covered = int((has_mask & ~required_mask).sum())
         
         # Required skills completion percentage
         required_completion = (required_covered / total_required * 100) if total_required > 0 else 0
@@ -593,70 +1032,25 @@ class CareerRecommendationPipeline:
             'optional_missing_count': optional_missing_count
         }
     
+    def _get_career_requirements(self, career: str) -> Dict[str, Any]:
+        """Career skills plus soft skills, with the arrays gap_analysis reduces over (cached per career)"""
+        if career not in self._career_requirements:
+            career_requirements = pd.concat(
+                [self._career_skill_frames[career], self._get_soft_skills_for_career(career)],
+                ignore_index=True
+            )
+            self._career_requirements[career] = {
+                'frame': career_requirements,
+                'skills_lower': career_requirements['skill'].str.lower().to_numpy(),
+                'required_mask': career_requirements['is_required'].to_numpy(dtype=bool),
+                'importance': career_requirements['importance'].to_numpy()
+            }
+        return self._career_requirements[career]
+    
     def _get_soft_skills_for_career(self, career: str) -> pd.DataFrame:
         """Add soft skills to career requirements"""
-        # Define soft skills for each career
-        soft_skills_mapping = {
-            'Data Scientist': [
-                {'skill': 'Communication', 'difficulty': 'Intermediate', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-                {'skill': 'Problem Solving', 'difficulty': 'Intermediate', 'importance': 9, 'is_required': True, 'category': 'soft', 'weight': 0.9},
-                {'skill': 'Critical Thinking', 'difficulty': 'Intermediate', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-                {'skill': 'Teamwork', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': False, 'category': 'soft', 'weight': 0.7},
-                {'skill': 'Leadership', 'difficulty': 'Intermediate', 'importance': 6, 'is_required': False, 'category': 'soft', 'weight': 0.6}
-            ],
-            'Data Engineer': [
-                {'skill': 'Communication', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': True, 'category': 'soft', 'weight': 0.7},
-                {'skill': 'Problem Solving', 'difficulty': 'Advanced', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-                {'skill': 'Attention to Detail', 'difficulty': 'Advanced', 'importance': 9, 'is_required': True, 'category': 'soft', 'weight': 0.9},
-                {'skill': 'Teamwork', 'difficulty': 'Intermediate', 'importance': 6, 'is_required': False, 'category': 'soft', 'weight': 0.6}
-            ],
-            'Machine Learning Engineer': [
-                {'skill': 'Communication', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': True, 'category': 'soft', 'weight': 0.7},
-                {'skill': 'Problem Solving', 'difficulty': 'Advanced', 'importance': 9, 'is_required': True, 'category': 'soft', 'weight': 0.9},
-                {'skill': 'Research Skills', 'difficulty': 'Advanced', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-                {'skill': 'Creativity', 'difficulty': 'Intermediate', 'importance': 6, 'is_required': False, 'category': 'soft', 'weight': 0.6}
-            ],
-            'Software Engineer': [
-                {'skill': 'Communication', 'difficulty': 'Intermediate', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-                {'skill': 'Problem Solving', 'difficulty': 'Advanced', 'importance': 9, 'is_required': True, 'category': 'soft', 'weight': 0.9},
-                {'skill': 'Teamwork', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': True, 'category': 'soft', 'weight': 0.7},
-                {'skill': 'Time Management', 'difficulty': 'Intermediate', 'importance': 6, 'is_required': False, 'category': 'soft', 'weight': 0.6}
-            ],
-            'Frontend Developer': [
-                {'skill': 'Communication', 'difficulty': 'Intermediate', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-                {'skill': 'Problem Solving', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': True, 'category': 'soft', 'weight': 0.7},
-                {'skill': 'Creativity', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': False, 'category': 'soft', 'weight': 0.7},
-                {'skill': 'User Empathy', 'difficulty': 'Intermediate', 'importance': 6, 'is_required': False, 'category': 'soft', 'weight': 0.6}
-            ],
-            'Backend Developer': [
-                {'skill': 'Communication', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': True, 'category': 'soft', 'weight': 0.7},
-                {'skill': 'Problem Solving', 'difficulty': 'Advanced', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-                {'skill': 'System Thinking', 'difficulty': 'Advanced', 'importance': 7, 'is_required': False, 'category': 'soft', 'weight': 0.7}
-            ],
-            'DevOps Engineer': [
-                {'skill': 'Communication', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': True, 'category': 'soft', 'weight': 0.7},
-                {'skill': 'Problem Solving', 'difficulty': 'Advanced', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-                {'skill': 'Incident Response', 'difficulty': 'Advanced', 'importance': 7, 'is_required': False, 'category': 'soft', 'weight': 0.7}
-            ],
-            'Product Manager': [
-                {'skill': 'Communication', 'difficulty': 'Advanced', 'importance': 10, 'is_required': True, 'category': 'soft', 'weight': 1.0},
-                {'skill': 'Leadership', 'difficulty': 'Advanced', 'importance': 9, 'is_required': True, 'category': 'soft', 'weight': 0.9},
-                {'skill': 'Problem Solving', 'difficulty': 'Advanced', 'importance': 9, 'is_required': True, 'category': 'soft', 'weight': 0.9},
-                {'skill': 'Strategic Thinking', 'difficulty': 'Advanced', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8}
-            ]
-        }
-        
         # Get soft skills for this career, or use default if not found
-        default_soft_skills = [
-            {'skill': 'Communication', 'difficulty': 'Intermediate', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8},
-            {'skill': 'Problem Solving', 'difficulty': 'Intermediate', 'importance': 9, 'is_required': True, 'category': 'soft', 'weight': 0.9},
-            {'skill': 'Teamwork', 'difficulty': 'Intermediate', 'importance': 7, 'is_required': False, 'category': 'soft', 'weight': 0.7},
-            {'skill': 'Leadership', 'difficulty': 'Intermediate', 'importance': 6, 'is_required': False, 'category': 'soft', 'weight': 0.6},
-            {'skill': 'Critical Thinking', 'difficulty': 'Intermediate', 'importance': 8, 'is_required': True, 'category': 'soft', 'weight': 0.8}
-        ]
-        
-        soft_skills = soft_skills_mapping.get(career, default_soft_skills)
-        return pd.DataFrame(soft_skills)
+        return _SOFT_SKILLS_DF_CACHE.get(career, _DEFAULT_SOFT_SKILLS_DF).copy(deep=False)
     
     def _determine_skill_level(self, skill: str, default_level: str) -> str:
         """
@@ -667,67 +1061,9 @@ class CareerRecommendationPipeline:
         if default_level and default_level.strip():
             return default_level
         
-        # Intelligent default level assignment based on skill characteristics
-        skill_lower = skill.lower()
-        
-        # Core programming languages - typically require intermediate+ level
-        core_languages = ['python', 'java', 'javascript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin', 'sql', 'r']
-        if skill_lower in core_languages:
-            return 'Intermediate'
-        
-        # Core data science libraries - typically require intermediate level
-        core_libraries = ['numpy', 'pandas', 'seaborn', 'matplotlib', 'scikit-learn', 'sklearn']
-        if skill_lower in core_libraries:
-            return 'Intermediate'
-        
-        # Advanced frameworks and tools - typically require advanced level
-        advanced_tools = ['tensorflow', 'pytorch', 'kubernetes', 'docker', 'spark', 'hadoop', 'kafka', 'elasticsearch', 'deep learning', 'neural networks']
-        if skill_lower in advanced_tools:
-            return 'Advanced'
-        
-        # Basic tools and utilities - typically beginner level
-        basic_tools = ['git', 'jupyter', 'excel', 'powerpoint', 'word', 'data visualization', 'data cleaning']
-        if skill_lower in basic_tools:
-            return 'Beginner'
-        
-        # Data science and ML concepts - vary by complexity
-        ml_concepts = {
-            'machine learning': 'Intermediate',
-            'statistics': 'Intermediate',
-            'feature engineering': 'Intermediate',
-            'model evaluation': 'Intermediate',
-            'a/b testing': 'Intermediate',
-            'business intelligence': 'Beginner'
-        }
-        if skill_lower in ml_concepts:
-            return ml_concepts[skill_lower]
-        
-        # Web development frameworks
-        web_frameworks = {
-            'react': 'Intermediate',
-            'angular': 'Advanced',
-            'vue.js': 'Intermediate',
-            'node.js': 'Intermediate',
-            'django': 'Intermediate',
-            'flask': 'Beginner',
-            'spring boot': 'Advanced',
-            'express.js': 'Beginner'
-        }
-        if skill_lower in web_frameworks:
-            return web_frameworks[skill_lower]
-        
-        # Cloud platforms
-        cloud_platforms = ['aws', 'azure', 'gcp', 'heroku', 'digitalocean']
-        if skill_lower in cloud_platforms:
-            return 'Intermediate'
-        
-        # Soft skills - typically intermediate level
-        soft_skills = ['communication', 'leadership', 'teamwork', 'problem solving', 'critical thinking', 'creativity']
-        if skill_lower in soft_skills:
-            return 'Intermediate'
-        
-        # Default to Beginner for all other skills
-        return 'Beginner'
+        # Intelligent default level assignment based on skill characteristics;
+        # default to Beginner for all other skills
+        return _SKILL_LEVEL_LOOKUP.get(skill.lower(), 'Beginner')
     
     def resume_analysis(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -751,26 +1087,33 @@ class CareerRecommendationPipeline:
         # Get career matches based on extracted skills
         career_matches = self.skill_matching(extracted_skills)
         
-        # Analyze keyword frequency for each career
+        # Analyze keyword frequency for each career: scan the text once with the master
+        # keyword pattern, then select the matching rows with a single vectorized mask
+        # (cleaned text is already lowercase)
+        keyword_hits = set(itertools.chain.from_iterable(
+            self._keyword_prefixes.get(keyword, ())
+            for keyword in set(self._keyword_master_re.findall(cleaned_text))
+        ))
+        keyword_hit_mask = self._keywords_lower.isin(keyword_hits).to_numpy()
+        
         career_keyword_analysis = {}
-        for career in self.career_keywords_df['career'].unique():
-            career_keywords = self.career_keywords_df[
-                self.career_keywords_df['career'] == career
+        for career, positions in self._keyword_positions_by_career.items():
+            hit_positions = positions[keyword_hit_mask[positions]]
+            
+            total_keywords = len(positions)
+            matched_keywords = [
+                {
+                    'keyword': keyword,
+                    'frequency': frequency,
+                    'importance': importance
+                }
+                for keyword, frequency, importance in zip(
+                    self._keyword_names[hit_positions].tolist(),
+                    self._keyword_frequencies[hit_positions].tolist(),
+                    self._keyword_importances[hit_positions].tolist()
+                )
             ]
-            
-            keyword_matches = 0
-            total_keywords = len(career_keywords)
-            matched_keywords = []
-            
-            for _, keyword_row in career_keywords.iterrows():
-                keyword = keyword_row['keyword'].lower()
-                if keyword in cleaned_text.lower():
-                    keyword_matches += 1
-                    matched_keywords.append({
-                        'keyword': keyword_row['keyword'],
-                        'frequency': keyword_row['frequency_percentage'],
-                        'importance': keyword_row['importance_score']
-                    })
+            keyword_matches = len(matched_keywords)
             
             keyword_fit_percentage = (keyword_matches / total_keywords * 100) if total_keywords > 0 else 0
             
@@ -781,38 +1124,55 @@ class CareerRecommendationPipeline:
             }
         
         # Combine skill matching and keyword analysis
+        top_matches = career_matches[:5]  # Top 5 matches
+        keyword_analyses = [career_keyword_analysis.get(match['career'], {}) for match in top_matches]
+        skill_fits = np.array([match['match_percentage'] for match in top_matches], dtype=np.float64)
+        keyword_fits = np.array(
+            [keyword_analysis.get('fit_percentage', 0) for keyword_analysis in keyword_analyses],
+            dtype=np.float64
+        )
+        
+        # Weighted combination (70% skills, 30% keywords), for all top matches at once. The
+        # original rounded float64 fits with NumPy, but fits of capped (int) skill scores were
+        # Python floats and used Python's round
+        combined_fits = skill_fits * 0.7 + keyword_fits * 0.3
+        overall_fits = [
+            round(combined_fit, 1) if isinstance(match['match_percentage'], int) else numpy_rounded
+            for match, combined_fit, numpy_rounded
+            in zip(top_matches, combined_fits.tolist(), np.round(combined_fits, 1).tolist())
+        ]
+        
+        # Best overall fit first; the stable sort keeps skill-match order on ties
+        fit_order = np.argsort(-np.array(overall_fits, dtype=np.float64), kind='stable')
+        
         final_analysis = []
-        for match in career_matches[:5]:  # Top 5 matches
+        for index in fit_order.tolist():
+            match = top_matches[index]
+            keyword_analysis = keyword_analyses[index]
             career = match['career']
             skill_match = match['match_percentage']
-            keyword_analysis = career_keyword_analysis.get(career, {})
             keyword_fit = keyword_analysis.get('fit_percentage', 0)
             
-            # Weighted combination (70% skills, 30% keywords)
-            combined_fit = (skill_match * 0.7) + (keyword_fit * 0.3)
-            
-            # Extract missing skills from dictionary format
-            missing_skills_list = []
-            if isinstance(match['missing_skills'], dict):
-                for category, skills in match['missing_skills'].items():
-                    if isinstance(skills, list):
-                        missing_skills_list.extend([skill['skill'] if isinstance(skill, dict) else skill for skill in skills])
-            elif isinstance(match['missing_skills'], list):
-                missing_skills_list = [skill['skill'] if isinstance(skill, dict) else skill for skill in match['missing_skills']]
+            # skill_matching always reports missing skills as {category: [skill records]};
+            # flatten lazily and stop after the top 5
+            missing_skills_list = [
+                skill['skill']
+                for skill in itertools.islice(itertools.chain.from_iterable(match['missing_skills'].values()), 5)
+            ]
             
             final_analysis.append({
                 'career': career,
-                'overall_fit': round(combined_fit, 1),
+                'overall_fit': overall_fits[index],
                 'skill_match': skill_match,
                 'keyword_fit': keyword_fit,
                 'matched_skills': match['matched_skills'],
-                'missing_skills': missing_skills_list[:5],  # Top 5 missing
+                'missing_skills': missing_skills_list,  # Top 5 missing
                 'matched_keywords': keyword_analysis.get('matched_keywords', [])[:5]
             })
         
         return {
             'extracted_skills': extracted_skills,
-            'career_fits': sorted(final_analysis, key=lambda x: x['overall_fit'], reverse=True),
+            'career_fits': final_analysis,
             'resume_summary': {
                 'total_words': len(cleaned_text.split()),
                 'skills_found': len(extracted_skills),
@@ -823,32 +1183,21 @@ class CareerRecommendationPipeline:
     def _clean_text(self, text: str) -> str:
         """Clean and preprocess text"""
         # Remove special characters and normalize whitespace
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip().lower()
+        return _WHITESPACE_RE.sub(' ', _NON_WORD_RE.sub(' ', text)).strip().lower()
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from text using pattern matching"""
-        # Get all available skills
-        all_skills = set(self.career_skills_df['skill'].str.lower().tolist())
-        
-        # Find skill matches
-        found_skills = []
-        for skill in all_skills:
-            if skill in text:
-                # Find the original case version
-                original_skill = self.career_skills_df[
-                    self.career_skills_df['skill'].str.lower() == skill
-                ]['skill'].iloc[0]
-                found_skills.append(original_skill)
+        # Find skill matches against the lowered skills prepared at load time
+        found_skills = [
+            self._skill_lower_to_original[skill] for skill in self._all_skills_lower if skill in text
+        ]
         
         # Remove duplicates and return
         return list(set(found_skills))
     
     def _analyze_sentiment(self, text: str) -> str:
         """Analyze sentiment of text"""
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
+        polarity = _text_polarity(text)
         
         if polarity > 0.1:
             return "Positive"
@@ -877,25 +1226,14 @@ class CareerRecommendationPipeline:
         required_missing = gap_analysis['required_missing']
         optional_missing = gap_analysis['optional_missing'][:3]  # Limit optional skills
         
-        # Prioritize core skills for Data Scientist
-        if target_career == 'Data Scientist':
-            core_skills = ['Python', 'SQL', 'Statistics', 'Machine Learning', 'Data Cleaning', 
-                          'Scikit-learn', 'Model Evaluation', 'Feature Engineering']
-            
-            # Reorder required missing skills to prioritize core skills
-            prioritized_required = []
-            other_required = []
-            
-            for skill_info in required_missing:
-                if skill_info['skill'] in core_skills:
-                    prioritized_required.append(skill_info)
-                else:
-                    other_required.append(skill_info)
-            
-            # Combine prioritized + other required + optional
-            missing_skills = prioritized_required + other_required + optional_missing
-        else:
-            missing_skills = required_missing + optional_missing
+        # Prioritize the career's core skills, if it defines any: the stable sort moves
+        # them ahead of the other required skills and keeps each group's order
+        core_skills = _CAREER_CORE_SKILLS.get(target_career)
+        if core_skills:
+            required_missing = sorted(required_missing, key=lambda skill_info: skill_info['skill'] not in core_skills)
+        
+        # Combine prioritized + other required + optional
+        missing_skills = required_missing + optional_missing
         
         # Find relevant courses with quality filtering
         learning_path = {
@@ -948,39 +1286,33 @@ class CareerRecommendationPipeline:
             if phase['skills']:
                 phase_skills = [s['skill'] for s in phase['skills']]
                 
-                # Filter courses by skill and level, prioritize high ratings
-                available_courses = self.courses_df[
-                    (self.courses_df['skill'].isin(phase_skills)) & 
-                    (self.courses_df['level'] == phase['level'])
-                ].copy()
+                # Collect courses by skill and level from the prebuilt index, in table order
+                course_positions = [
+                    self._course_positions_by_skill_level.get((skill, phase['level']), _NO_POSITIONS)
+                    for skill in dict.fromkeys(phase_skills)
+                ]
+                available_courses = self.courses_df.iloc[np.sort(np.concatenate(course_positions))]
                 
                 if not available_courses.empty:
-                    # Sort by rating (descending) and prioritize courses ≥ 4.3⭐
-                    available_courses = available_courses.sort_values('rating', ascending=False)
+                    # Sort by rating (descending) and take the top two: courses ≥ 4.3⭐
+                    # come first, others only fill the remaining slots
+                    top_courses = available_courses.sort_values('rating', ascending=False).head(2)
                     
-                    # Get high-quality courses first (≥ 4.3⭐)
-                    high_quality = available_courses[available_courses['rating'] >= 4.3]
-                    other_courses = available_courses[available_courses['rating'] < 4.3]
+                    # Ratings are sorted descending, so courses ≥ 4.3⭐ form a prefix
+                    # whose length a single searchsorted finds
+                    high_quality_count = np.searchsorted(-top_courses['rating'].to_numpy(), -4.3, side='right')
                     
-                    # Select courses: high-quality first, then others if needed
+                    # One pass over the selected rows: build the course records and
+                    # flag the low-rated ones after the high-quality prefix
                     selected_courses = []
-                    if not high_quality.empty:
-                        selected_courses.extend(high_quality.head(2).to_dict('records'))
-                    
-                    # If we need more courses or no high-quality ones, add others
-                    if len(selected_courses) < 2 and not other_courses.empty:
-                        remaining = 2 - len(selected_courses)
-                        selected_courses.extend(other_courses.head(remaining).to_dict('records'))
+                    for position, course_row in enumerate(top_courses.itertuples(index=False, name='Course')):
+                        course = course_row._asdict()
+                        if position >= high_quality_count:
+                            course['low_rating_warning'] = True
+                        selected_courses.append(course)
                     
                     phase['courses'] = selected_courses
-                    
-                    # Calculate total hours for this phase
                     phase['hours'] = sum(course.get('duration_hours', 0) for course in selected_courses)
-                    
-                    # Flag courses with low ratings
-                    for course in phase['courses']:
-                        if course.get('rating', 0) < 4.3:
-                            course['low_rating_warning'] = True
                 
                 learning_path['phases'].append(phase)
         
@@ -1025,39 +1357,53 @@ class CareerRecommendationPipeline:
         ].iloc[0]
         
         # Get recent job posts with enhanced filtering
-        recent_jobs = self.job_posts_df[
-            self.job_posts_df['title'].str.contains(career, case=False, na=False)
-        ].head(8)  # Get more jobs for better variety
+        job_positions = self._job_positions_by_career.get(career)
+        if job_positions is None:
+            job_positions = np.flatnonzero(
+                self.job_posts_df['title'].str.contains(career, case=False, na=False, regex=False)
+            )
+        recent_jobs = self.job_posts_df.iloc[job_positions[:8]]  # Get more jobs for better variety
+        
+        # Format experience level
+        experience_mapping = {
+            'Entry': 'Junior',
+            'Mid': 'Mid-level',
+            'Senior': 'Senior',
+            'Lead': 'Lead',
+            'Principal': 'Principal'
+        }
+        
+        # Format job type
+        job_type_mapping = {
+            'Full-time': 'Full-time',
+            'Part-time': 'Part-time',
+            'Contract': 'Contract',
+            'Remote': 'Remote'
+        }
         
-        # Process job listings with skills matching
+        # Process job listings with skills matching; with at most 8 jobs, one zip over the
+        # columns is cheaper than column-wise pandas operations
+        user_skill_set = set([skill.lower() for skill in user_skills]) if user_skills else None
+        columns = recent_jobs.columns.tolist()
         enhanced_jobs = []
-        for _, job in recent_jobs.iterrows():
-            job_dict = job.to_dict()
+        for values, job_skills, job_skill_set in zip(
+            zip(*(recent_jobs[column].tolist() for column in columns)),
+            self._job_required_skills.loc[recent_jobs.index],
+            self._job_required_skills_lower.loc[recent_jobs.index]
+        ):
+            job_dict = dict(zip(columns, values))
             
             # Clean and format job data
-            job_dict['formatted_salary'] = f"${job['min_salary']:,} – ${job['max_salary']:,}"
-            job_dict['avg_salary'] = (job['min_salary'] + job['max_salary']) // 2
+            job_dict['formatted_salary'] = f"${job_dict['min_salary']:,} – ${job_dict['max_salary']:,}"
+            job_dict['avg_salary'] = (job_dict['min_salary'] + job_dict['max_salary']) // 2
             
-            # Parse required skills
-            required_skills = [skill.strip() for skill in job['required_skills'].split(',')]
+            # Required skills were parsed at load time; copy the list so callers can't alter the cache
+            required_skills = list(job_skills)
             job_dict['required_skills'] = required_skills
             
             # Skills matching analysis
             if user_skills:
-                user_skill_set = set([skill.lower() for skill in user_skills])
-                job_skill_set = set([skill.lower() for skill in required_skills])
-                
-                # Calculate match score
-                matched_skills = user_skill_set.intersection(job_skill_set)
-                match_score = len(matched_skills) / len(job_skill_set) * 100 if job_skill_set else 0
-                
-                job_dict['skills_analysis'] = {
-                    'matched_skills': list(matched_skills),
-                    'missing_skills': list(job_skill_set - user_skill_set),
-                    'match_score': round(match_score, 1),
-                    'total_skills': len(job_skill_set),
-                    'matched_count': len(matched_skills)
-                }
+                job_dict['skills_analysis'] = self._job_skills_analysis(user_skill_set, job_skill_set)
             else:
                 job_dict['skills_analysis'] = {
                     'matched_skills': [],
@@ -1067,24 +1413,8 @@ class CareerRecommendationPipeline:
                     'matched_count': 0
                 }
             
-            # Format experience level
-            experience_mapping = {
-                'Entry': 'Junior',
-                'Mid': 'Mid-level',
-                'Senior': 'Senior',
-                'Lead': 'Lead',
-                'Principal': 'Principal'
-            }
-            job_dict['experience_display'] = experience_mapping.get(job['experience_level'], job['experience_level'])
-            
-            # Format job type
-            job_type_mapping = {
-                'Full-time': 'Full-time',
-                'Part-time': 'Part-time',
-                'Contract': 'Contract',
-                'Remote': 'Remote'
-            }
-            job_dict['job_type_display'] = job_type_mapping.get(job['job_type'], job['job_type'])
+            job_dict['experience_display'] = experience_mapping.get(job_dict['experience_level'], job_dict['experience_level'])
+            job_dict['job_type_display'] = job_type_mapping.get(job_dict['job_type'], job_dict['job_type'])
             
             enhanced_jobs.append(job_dict)
         
@@ -1146,50 +1476,31 @@ class CareerRecommendationPipeline:
             'skills_analysis_enabled': user_skills is not None
         }
     
+    @staticmethod
+    def _job_skills_analysis(user_skill_set: set, job_skill_set: FrozenSet[str]) -> Dict[str, Any]:
+        """Compare a user's lowered skill set against one job's lowered required skills"""
+        # Calculate match score
+        matched_skills = user_skill_set.intersection(job_skill_set)
+        match_score = len(matched_skills) / len(job_skill_set) * 100 if job_skill_set else 0
+        
+        return {
+            'matched_skills': list(matched_skills),
+            'missing_skills': list(job_skill_set - user_skill_set),
+            'match_score': round(match_score, 1),
+            'total_skills': len(job_skill_set),
+            'matched_count': len(matched_skills)
+        }
+    
     def _get_demand_status(self, demand_index: int) -> Dict[str, str]:
         """Get demand status description based on demand index"""
-        if demand_index >= 85:
-            return {
-                'level': 'Very High',
-                'description': 'Excellent job prospects with high demand'
-            }
-        elif demand_index >= 70:
-            return {
-                'level': 'High',
-                'description': 'Strong job market with good opportunities'
-            }
-        elif demand_index >= 50:
-            return {
-                'level': 'Moderate',
-                'description': 'Stable job market with steady demand'
-            }
-        else:
-            return {
-                'level': 'Lower',
-                'description': 'Competitive market, focus on differentiation'
-            }
+        return dict(_DEMAND_STATUSES[bisect.bisect_right(_DEMAND_THRESHOLDS, demand_index)])
     
     def _get_growth_trend(self, growth_rate: int) -> Dict[str, str]:
         """Get growth trend description based on growth rate"""
-        if growth_rate >= 20:
-            return {
-                'trend': '📈 Rapid Growth',
-                'description': f'Fast-growing field with {growth_rate}% annual growth'
-            }
-        elif growth_rate >= 10:
-            return {
-                'trend': '📈 Steady Growth',
-                'description': f'Growing field with {growth_rate}% annual growth'
-            }
-        elif growth_rate >= 5:
-            return {
-                'trend': '➡️ Stable',
-                'description': f'Stable field with {growth_rate}% annual growth'
-            }
-        else:
-            return {
-                'trend': '📉 Slow Growth',
-                'description': f'Slow growth field with {growth_rate}% annual growth'
+        trend, description = _GROWTH_TRENDS[bisect.bisect_right(_GROWTH_THRESHOLDS, growth_rate)]
+        return {
+            'trend': trend,
+            'description': description.format(growth_rate=growth_rate)
         }
     
     def peer_benchmarking(self, user_skills: List[str], target_career: str) -> Dict[str, Any]:
@@ -1198,49 +1509,63 @@ class CareerRecommendationPipeline:
             return {"error": "Career not found"}
         
         # Get peer profiles for the career
-        peers = self.peer_profiles_df[
-            self.peer_profiles_df['career'] == target_career
-        ]
+        peer_positions = np.flatnonzero(self.peer_profiles_df['career'] == target_career)
+        peers = self.peer_profiles_df.iloc[peer_positions]
         
         if peers.empty:
             return {"error": "No peer data available"}
         
         user_skill_set = set([skill.lower() for skill in user_skills])
         
+        # Peer skills were split and lowered at load time; select this career's rows
+        peer_skill_rows = self._peer_skill_rows.loc[peer_positions]
+        
+        # Only the first PEER_PROFILES_SHOWN peers are returned, so only their records are built
+        shown_peers = peers.iloc[:PEER_PROFILES_SHOWN]
+        shown_positions = peer_positions[:PEER_PROFILES_SHOWN]
+        skill_lists = [list(self._peer_skill_lists[position]) for position in shown_positions.tolist()]
+        skill_counts = self._peer_skill_counts[shown_positions].tolist()
+        
+        # Skill overlap with those peers at once: AND the user's bit words into the
+        # peers' packed skill words and count the set bits
+        user_skill_mask = np.zeros(len(self._peer_skill_bit), dtype=bool)
+        user_skill_mask[[self._peer_skill_bit[skill] for skill in user_skill_set if skill in self._peer_skill_bit]] = True
+        skill_overlaps = _popcount_rows(
+            self._peer_skill_bits[shown_positions] & _pack_bit_words(user_skill_mask)
+        ).tolist()
+        
         # Analyze peer skills
-        peer_skill_analysis = []
-        for _, peer in peers.iterrows():
-            peer_skills = [s.strip().lower() for s in peer['skills'].split(',')]
-            peer_skill_set = set(peer_skills)
-            
-            skill_overlap = len(user_skill_set.intersection(peer_skill_set))
-            total_peer_skills = len(peer_skill_set)
-            
-            peer_skill_analysis.append({
-                'experience_years': peer['experience_years'],
-                'education': peer['education'],
-                'salary': peer['salary'],
+        peer_skill_analysis = [
+            {
+                'experience_years': experience_years,
+                'education': education,
+                'salary': salary,
                 'skill_count': total_peer_skills,
                 'skill_overlap': skill_overlap,
                 'skills': peer_skills
-            })
+            }
+            for experience_years, education, salary, total_peer_skills, skill_overlap, peer_skills in zip(
+                shown_peers['experience_years'], shown_peers['education'], shown_peers['salary'],
+                skill_counts, skill_overlaps, skill_lists
+            )
+        ]
         
         # Calculate statistics
         avg_experience = peers['experience_years'].mean()
         avg_salary = peers['salary'].mean()
-        avg_skill_count = peers['skills'].apply(lambda x: len(x.split(','))).mean()
-        
-        # Find most common skills among peers
-        all_peer_skills = []
-        for _, peer in peers.iterrows():
-            all_peer_skills.extend([s.strip().lower() for s in peer['skills'].split(',')])
+        avg_skill_count = self._peer_raw_skill_counts[peer_positions].mean()
         
-        from collections import Counter
-        skill_frequency = Counter(all_peer_skills)
-        most_common_skills = skill_frequency.most_common(10)
+        # Find most common skills among peers: counts in first-seen order, then a stable
+        # descending sort so ties rank by first appearance
+        skill_frequency = peer_skill_rows.value_counts(sort=False)
+        top_skill_order = np.argsort(-skill_frequency.to_numpy(), kind='stable')[:10]
+        most_common_skills = list(zip(
+            skill_frequency.index[top_skill_order].tolist(),
+            skill_frequency.to_numpy()[top_skill_order].tolist()
+        ))
         
         # Find skills user is missing that peers have
-        peer_skill_set = set(all_peer_skills)
+        peer_skill_set = set(skill_frequency.index)
         missing_common_skills = list(peer_skill_set - user_skill_set)
         
         return {
@@ -1253,33 +1578,37 @@ class CareerRecommendationPipeline:
             },
             'most_common_skills': most_common_skills,
             'missing_common_skills': missing_common_skills[:5],
-            'peer_profiles': peer_skill_analysis[:5]  # Top 5 for display
+            'peer_profiles': peer_skill_analysis
         }
     
     def chatbot_response(self, question: str) -> Dict[str, Any]:
         """Get chatbot response for career-related questions"""
-        question_lower = question.lower()
-        
-        # Simple keyword matching for now
-        best_match = None
-        best_score = 0
-        
-        for qa in self.qa_data:
-            # Calculate similarity score
-            qa_question = qa['question'].lower()
-            qa_tags = [tag.lower() for tag in qa['tags']]
-            
-            # Check for keyword matches
-            score = 0
-            for word in question_lower.split():
-                if word in qa_question:
-                    score += 2
-                if word in qa_tags:
-                    score += 1
-            
-            if score > best_score:
-                best_score = score
-                best_match = qa
+        # Scoring only sees the lowered words, so the lowered, stripped question is an
+        # exact cache key; hand out a copy so callers can't alter the cached answer
+        return dict(self._chatbot_answer(question.lower().strip()))
+    
+    def _compute_qa_postings(self, word: str) -> Tuple[Tuple[int, int], ...]:
+        """(qa_id, weight) pairs for a query word; memoized as _qa_postings"""
+        weights = dict.fromkeys(
+            (qa_id for qa_id, question in enumerate(self._qa_questions_lower) if word in question), 2
+        )
+        for qa_id in self._qa_tag_index.get(word, ()):
+            weights[qa_id] = weights.get(qa_id, 0) + 1
+        return tuple(weights.items())
+    
+    def _answer_question(self, question_lower: str) -> Dict[str, Any]:
+        """Keyword-match a lowercased question against the QA data; memoized as _chatbot_answer"""
+        # Keyword scores as a scatter-add over the inverted index: +2 when the word occurs in
+        # the question, +1 when it is one of the tags
+        scores = np.zeros(len(self.qa_data), dtype=np.int32)
+        for word in question_lower.split():
+            for qa_id, weight in self._qa_postings(word):
+                scores[qa_id] += weight
+        
+        # argmax returns the first highest score, matching the first-best-wins scan
+        best_idx = int(scores.argmax()) if len(scores) else 0
+        best_score = int(scores[best_idx]) if len(scores) else 0
+        best_match = self.qa_data[best_idx] if best_score > 0 else None
         
         if best_match and best_score > 0:
             return {
@@ -1307,112 +1636,10 @@ class CareerRecommendationPipeline:
         skill_lower = skill_name.lower()
         synonyms = [skill_name]  # Always include the original skill name
         
-        # Check if this skill has synonyms in our mapping
-        for canonical_skill, skill_synonyms in self._get_skill_synonym_mapping().items():
-            if skill_lower == canonical_skill.lower():
-                synonyms.extend(skill_synonyms)
-                break
-            # Also check if the skill is in the synonyms list
-            elif skill_lower in [s.lower() for s in skill_synonyms]:
-                synonyms.extend(skill_synonyms)
-                break
+        # Check if this skill is a canonical name or synonym in our mapping
+        synonyms.extend(_SYNONYM_INDEX.get(skill_lower, ()))
         
         return list(set(synonyms))  # Remove duplicates
-    
-    def _get_skill_synonym_mapping(self) -> Dict[str, List[str]]:
-        """Get the skill synonym mapping dictionary"""
-        return {
-            # Programming Languages
-            "python": ["python", "py", "python3", "python3.8", "python3.9", "python3.10"],
-            "sql": ["sql", "mysql", "postgresql", "sqlite", "tsql", "plsql", "database", "db", "rdbms"],
-            "java": ["java", "jdk", "jvm", "spring", "maven", "gradle"],
-            "javascript": ["javascript", "js", "ecmascript", "es6", "es2015", "es2017", "es2020"],
-            "c++": ["c++", "cpp", "c plus plus", "stl", "boost"],
-            "c#": ["c#", "csharp", "dotnet", ".net", "asp.net", "entity framework"],
-            
-            # Data Science & ML
-            "machine learning": ["machine learning", "ml", "ai", "artificial intelligence", "deep learning", "neural networks", "predictive modeling"],
-            "deep learning": ["deep learning", "neural networks", "cnn", "rnn", "lstm", "transformer", "bert", "gpt"],
-            "data science": ["data science", "data scientist", "analytics", "predictive analytics"],
-            "statistics": ["statistics", "stats", "statistical analysis", "hypothesis testing", "regression", "correlation", "anova"],
-            
-            # Data Visualization & Tools
-            "data visualization": ["data visualization", "visualization", "viz", "matplotlib", "seaborn", "plotly", "tableau", "powerbi", "d3.js", "ggplot"],
-            "visualization": ["visualization", "data visualization", "viz", "charts", "graphs", "dashboards", "data viz"],
-            "pandas": ["pandas", "pd", "dataframe", "data manipulation", "data analysis"],
-            "numpy": ["numpy", "np", "numerical computing", "arrays", "matrices"],
-            "scikit-learn": ["scikit-learn", "sklearn", "machine learning library", "ml library", "scikit"],
-            
-            # ML/AI Frameworks
-            "tensorflow": ["tensorflow", "tf", "deep learning framework", "neural networks", "keras"],
-            "pytorch": ["pytorch", "torch", "deep learning", "ml framework", "neural networks"],
-            "keras": ["keras", "deep learning", "neural networks", "tensorflow"],
-            
-            # Web Development
-            "react": ["react", "reactjs", "react.js", "jsx", "hooks", "redux", "context"],
-            "angular": ["angular", "angularjs", "ng", "angular 2+", "angular material"],
-            "vue.js": ["vue", "vue.js", "vuejs", "vue 3", "composition api"],
-            "node.js": ["node.js", "nodejs", "node", "express", "npm", "yarn"],
-            "html": ["html", "html5", "markup", "semantic html", "accessibility"],
-            "css": ["css", "css3", "styling", "responsive design", "flexbox", "grid", "sass", "less"],
-            "typescript": ["typescript", "ts", "typed javascript", "type safety"],
-            
-            # Python Web Frameworks
-            "flask": ["flask", "python web framework", "microframework", "wsgi"],
-            "django": ["django", "python web framework", "mvt", "admin panel", "orm"],
-            "fastapi": ["fastapi", "python web framework", "async", "api", "pydantic"],
-            
-            # Java Frameworks
-            "spring boot": ["spring boot", "spring", "java framework", "dependency injection", "aop"],
-            "spring": ["spring", "spring framework", "spring boot", "java framework"],
-            
-            # DevOps & Cloud
-            "docker": ["docker", "containerization", "containers", "dockerfile", "docker compose"],
-            "kubernetes": ["kubernetes", "k8s", "container orchestration", "microservices", "deployment"],
-            "aws": ["aws", "amazon web services", "ec2", "s3", "lambda", "rds", "cloudfront", "route53"],
-            "azure": ["azure", "microsoft azure", "cloud computing", "vm", "blob storage", "functions"],
-            "gcp": ["gcp", "google cloud platform", "google cloud", "compute engine", "cloud storage"],
-            
-            # Big Data
-            "hadoop": ["hadoop", "apache hadoop", "big data", "mapreduce", "hdfs", "yarn"],
-            "spark": ["spark", "apache spark", "big data", "distributed computing", "dataframes", "streaming"],
-            "kafka": ["kafka", "apache kafka", "streaming", "message queue", "event streaming"],
-            
-            # Databases
-            "mongodb": ["mongodb", "nosql", "document database", "mongo", "aggregation"],
-            "postgresql": ["postgresql", "postgres", "relational database", "rdbms", "acid"],
-            "mysql": ["mysql", "relational database", "rdbms", "maria db", "innodb"],
-            "redis": ["redis", "in-memory database", "cache", "key-value store", "data structures"],
-            
-            # Infrastructure & Tools
-            "terraform": ["terraform", "infrastructure as code", "iac", "hashicorp", "provisioning"],
-            "jenkins": ["jenkins", "ci/cd", "continuous integration", "automation", "pipeline"],
-            "git": ["git", "github", "gitlab", "version control", "vcs", "source control"],
-            "linux": ["linux", "unix", "ubuntu", "centos", "debian", "red hat", "shell"],
-            
-            # Testing
-            "selenium": ["selenium", "web testing", "automated testing", "browser automation", "webdriver"],
-            "junit": ["junit", "java testing", "unit testing", "test framework", "tdd"],
-            "pytest": ["pytest", "python testing", "unit testing", "test framework", "fixtures"],
-            
-            # Design & UX
-            "figma": ["figma", "ui design", "ux design", "prototyping", "design tools", "collaboration"],
-            "adobe xd": ["adobe xd", "ux design", "prototyping", "design tools", "wireframing"],
-            "sketch": ["sketch", "ui design", "mac design tool", "prototyping", "design systems"],
-            
-            # Project Management
-            "agile": ["agile", "scrum", "kanban", "project management", "iterative", "adaptive"],
-            "scrum": ["scrum", "agile methodology", "sprint planning", "standup", "retrospective"],
-            "jira": ["jira", "project management", "issue tracking", "agile tools", "atlassian"],
-            
-            # Specialized Skills
-            "etl": ["etl", "extract transform load", "data pipeline", "data integration", "data processing"],
-            "data modeling": ["data modeling", "database design", "schema design", "normalization", "erd"],
-            "api": ["api", "rest api", "graphql", "web services", "endpoints", "microservices"],
-            "microservices": ["microservices", "microservice architecture", "distributed systems", "service mesh"],
-            "ci/cd": ["ci/cd", "continuous integration", "continuous deployment", "devops", "automation"],
-            "mlops": ["mlops", "machine learning operations", "model deployment", "model monitoring", "ml infrastructure"]
-            }
 
 # Example usage and testing
 if __name__ == "__main__":
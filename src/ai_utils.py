@@ -1,14 +1,101 @@
 import json
+import re
+import functools
+import hashlib
+import sqlite3
+import threading
+import atexit
 import numpy as np
-from sentence_transformers import SentenceTransformer, util
-import spacy
+import torch
+from sentence_transformers import SentenceTransformer
 import pdfplumber
 import os
+from dataclasses import dataclass
 import requests
+from concurrent.futures import ThreadPoolExecutor
+try:
+    from .ranking import top_n_indices
+except ImportError:  # Imported as a top-level module, with src/ on sys.path
+    from ranking import top_n_indices
 
 # Load models
-model = SentenceTransformer('all-MiniLM-L6-v2')
-nlp = spacy.load('en_core_web_sm')
+MODEL_NAME = 'all-MiniLM-L6-v2'
+model = SentenceTransformer(MODEL_NAME)
+
+# Opt-in (EMBEDDING_INT8=1): on CPU, quantize the transformer's Linear layers to int8 with
+# dynamic quantization. Off by default: int8 embeddings shift the cosine scores that the
+# chatbot_query threshold was tuned on, and eager-mode quantization is deprecated in torch
+EMBEDDING_INT8 = os.getenv('EMBEDDING_INT8', '0') == '1' and model.device.type == 'cpu'
+if EMBEDDING_INT8:
+    torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+# Identifies the embedding space in cache keys: int8 vectors differ slightly from FP32
+EMBEDDING_MODEL_TAG = f"{MODEL_NAME}-int8" if EMBEDDING_INT8 else MODEL_NAME
+
+# On-disk embedding cache keyed by model tag + text hash, so restarts skip re-encoding.
+# SQLite serializes writers across processes; the connection is opened on first use.
+EMBEDDING_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'embeddings.sqlite3'
+)
+# Largest number of keys looked up per query, below SQLite's bound-parameter limit
+_CACHE_LOOKUP_BATCH = 500
+_embedding_cache = None
+_embedding_cache_lock = threading.Lock()
+
+def _embedding_key(text):
+    """Cache key for a text's embedding under the current model."""
+    return hashlib.blake2b(f"{EMBEDDING_MODEL_TAG}\0{text}".encode('utf-8'), digest_size=16).hexdigest()
+
+def _get_embedding_cache():
+    """The shared cache connection, opened (and closed at exit) on first use; hold _embedding_cache_lock."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        os.makedirs(os.path.dirname(EMBEDDING_CACHE_PATH), exist_ok=True)
+        _embedding_cache = sqlite3.connect(EMBEDDING_CACHE_PATH, timeout=30, check_same_thread=False)
+        _embedding_cache.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        atexit.register(_embedding_cache.close)
+    return _embedding_cache
+
+def _read_cached_embeddings(keys):
+    """Cached fp16 vectors for the keys that have one, as {key: vector}."""
+    keys = list(dict.fromkeys(keys))
+    vectors = {}
+    with _embedding_cache_lock:
+        cache = _get_embedding_cache()
+        for start in range(0, len(keys), _CACHE_LOOKUP_BATCH):
+            batch = keys[start:start + _CACHE_LOOKUP_BATCH]
+            rows = cache.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+            )
+            vectors.update((key, np.frombuffer(blob, dtype=np.float16)) for key, blob in rows)
+    return vectors
+
+def _write_cached_embeddings(vectors):
+    """Store {key: fp16 vector} in one transaction."""
+    with _embedding_cache_lock:
+        cache = _get_embedding_cache()
+        with cache:
+            cache.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                              [(key, vector.tobytes()) for key, vector in vectors.items()])
+
+def cached_encode(texts):
+    """L2-normalized embeddings for a list of texts, encoding only cache misses (in one batch)."""
+    if not texts:
+        return np.empty((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+    keys = [_embedding_key(text) for text in texts]
+    vectors = _read_cached_embeddings(keys)
+    # Encode outside the lock so other threads can keep reading the cache
+    missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+    if missing:
+        encoded = model.encode(list(missing.values()), batch_size=32,
+                               convert_to_numpy=True, normalize_embeddings=True)
+        fresh = {key: embedding.astype(np.float16) for key, embedding in zip(missing, encoded)}
+        _write_cached_embeddings(fresh)
+        vectors.update(fresh)
+    # Vectors are stored as fp16 to halve the cache; hits and fresh misses both come back
+    # as fp16, so the same text always yields the same float32 vector
+    return np.stack([vectors[key] for key in keys]).astype(np.float32)
 
 # LinkedIn Jobs API setup (via RapidAPI)
 RAPIDAPI_KEY = os.getenv('RAPIDAPI_KEY')
@@ -22,9 +109,13 @@ headers = {
     "X-RapidAPI-Host": RAPIDAPI_HOST
 }
 
-# In-memory cache
-careers = {}
-career_embeddings = {}
+JOBS_PER_PAGE = 25  # API max per page
+
+def _fetch_jobs_page(session, params, page):
+    """Fetch one page of job listings; returns the decoded JSON payload."""
+    response = session.get(BASE_URL, params={**params, 'page': page})
+    response.raise_for_status()
+    return response.json()
 
 def fetch_jobs(keyword="software", location="USA", limit=50):
     """Fetch job listings from LinkedIn Jobs API via RapidAPI."""
@@ -32,23 +123,50 @@ def fetch_jobs(keyword="software", location="USA", limit=50):
     params = {
         "keywords": keyword,
         "location": location,
-        "page": 1,
-        "limit": 25  # Max per page
+        "limit": JOBS_PER_PAGE
     }
-    while len(jobs) < limit:
-        try:
-            response = requests.get(BASE_URL, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-            jobs.extend(data.get('jobs', []))
-            if not data.get('has_more', False) or len(jobs) >= limit:
-                break
-            params['page'] += 1
-        except requests.RequestException as e:
-            print(f"Error fetching jobs: {e}")
-            break
+    next_page = 1
+    has_more = True
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=8) as executor:
+        session.headers.update(headers)
+        while has_more and len(jobs) < limit:
+            # Page 1 tells us whether more pages exist; after that, fetch concurrently as many
+            # pages as the remaining jobs need if full, and another batch if some come back short
+            n_pages = 1 if next_page == 1 else -(-(limit - len(jobs)) // JOBS_PER_PAGE)
+            futures = [executor.submit(_fetch_jobs_page, session, params, page)
+                       for page in range(next_page, next_page + n_pages)]
+            next_page += n_pages
+            # Keep pages in order, stopping after the last page the API reported
+            for future in futures:
+                try:
+                    data = future.result()
+                except requests.RequestException as e:
+                    print(f"Error fetching jobs: {e}")
+                    has_more = False
+                    break
+                jobs.extend(data.get('jobs', []))
+                has_more = data.get('has_more', False)
+                if not has_more or len(jobs) >= limit:
+                    break
+            for future in futures:
+                future.cancel()
     return jobs[:limit]
 
+# Skills recognized in job descriptions and resumes
+KNOWN_SKILLS = ['Python', 'SQL', 'JavaScript', 'Java', 'Machine Learning',
+                'AWS', 'Docker', 'React', 'Git', 'Agile']  # Add more as needed
+_KNOWN_SKILLS_BY_LOWER = {skill.lower(): skill for skill in KNOWN_SKILLS}
+# One alternation finds every known skill in a single pass; longest names first so
+# e.g. 'JavaScript' wins over 'Java', and word boundaries keep 'Java' out of 'JavaScript'
+_KNOWN_SKILLS_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(skill) for skill in sorted(KNOWN_SKILLS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
+def find_known_skills(text):
+    """Known skills mentioned in text, in order of first mention."""
+    return list(dict.fromkeys(_KNOWN_SKILLS_BY_LOWER[match.lower()] for match in _KNOWN_SKILLS_RE.findall(text)))
+
 def extract_career_data(jobs):
     """Extract career data (title, skills, salary, etc.) from job listings."""
     career_data = {}
@@ -56,11 +174,7 @@ def extract_career_data(jobs):
         title = job.get('job_position', 'Unknown')
         # Parse skills from job description (basic keyword extraction)
         description = job.get('job_description', '')
-        doc = nlp(description)
-        skills = [ent.text for ent in doc.ents if ent.label_ in ['SKILL', 'ORG', 'PRODUCT']]
-        # Deduplicate and filter skills
-        skills = list(set(skills) & set(['Python', 'SQL', 'JavaScript', 'Java', 'Machine Learning',
-                                        'AWS', 'Docker', 'React', 'Git', 'Agile']))  # Add more as needed
+        skills = find_known_skills(description)
         salary = job.get('salary', '0')  # Parse or estimate if string
         salary = int(salary.replace('$', '').replace(',', '').split('-')[0]) if salary and '$' in salary else 100000
         career_data[title] = {
@@ -71,13 +185,51 @@ def extract_career_data(jobs):
         }
     return career_data
 
-# Precompute career data
-jobs = fetch_jobs()
-careers = extract_career_data(jobs)
-for title, data in careers.items():
-    skill_str = ' '.join(data['skills'])
-    if skill_str:
-        career_embeddings[title] = model.encode(skill_str)
+@dataclass
+class CareerTable:
+    """Career catalog as parallel columns; row i of every field describes titles[i]."""
+    titles: list
+    ids: dict                  # title -> row id
+    skill_sets: list           # frozenset of skills per career
+    salaries: np.ndarray       # average salary per career
+    embedded_ids: np.ndarray   # row ids of careers with skills, aligned with embeddings
+    embeddings: np.ndarray     # (len(embedded_ids), dim) L2-normalized skill embeddings
+    ann_index: object = None   # optional HNSW index over embeddings
+
+# Large career catalogs are searched with an approximate HNSW index when hnswlib is
+# installed; below this size the exact matrix-vector product is faster
+ANN_MIN_CAREERS = 5000
+
+def build_career_table(career_data):
+    """Build the columnar career catalog, encoding all career skill strings in one batch."""
+    titles = list(career_data)
+    skill_strs = [' '.join(career_data[title]['skills']) for title in titles]
+    embedded_ids = np.array([i for i, skill_str in enumerate(skill_strs) if skill_str], dtype=np.intp)
+    table = CareerTable(
+        titles=titles,
+        ids={title: i for i, title in enumerate(titles)},
+        skill_sets=[frozenset(career_data[title]['skills']) for title in titles],
+        salaries=np.array([career_data[title]['average_salary'] for title in titles], dtype=np.int64),
+        embedded_ids=embedded_ids,
+        embeddings=cached_encode([skill_strs[i] for i in embedded_ids])
+    )
+    if len(embedded_ids) >= ANN_MIN_CAREERS:
+        try:
+            import hnswlib
+            # Rows are L2-normalized, so inner-product space ranks by cosine similarity
+            table.ann_index = hnswlib.Index(space='ip', dim=table.embeddings.shape[1])
+            table.ann_index.init_index(max_elements=len(embedded_ids), M=16, ef_construction=100)
+            table.ann_index.add_items(table.embeddings, np.arange(len(embedded_ids)))
+            table.ann_index.set_ef(32)
+        except ImportError:
+            print("hnswlib not available; using exact career matching")
+    return table
+
+@functools.lru_cache(maxsize=1)
+def _load_careers():
+    """Fetch jobs and build the career catalog on first use (importing stays free of network calls)."""
+    careers = extract_career_data(fetch_jobs())
+    return careers, build_career_table(careers)
 
 # Minimal FAQ for chatbot (MVP; replace with xAI Grok API in Phase 5)
 faq = [
@@ -85,21 +237,30 @@ faq = [
     {"question": "How to become a Software Engineer?", "answer": "Learn Python or Java, data structures, algorithms, and Git. Practice on LeetCode."},
     {"question": "What skills are needed for Data Scientist?", "answer": "Python, SQL, machine learning, statistics, and data visualization (e.g., Tableau)."}
 ]
-faq_embeddings = np.array([model.encode(q['question']) for q in faq])
+
+@functools.lru_cache(maxsize=1)
+def _load_faq_embeddings():
+    """Encode the FAQ questions on first use."""
+    return cached_encode([q['question'] for q in faq])
 
 def match_skills(user_skills):
     """Match user skills to careers using cosine similarity."""
     user_skill_str = ' '.join(user_skills)
-    user_emb = model.encode(user_skill_str)
-    matches = []
-    for career, emb in career_embeddings.items():
-        similarity = util.cosine_similarity(user_emb.reshape(1, -1), emb.reshape(1, -1))[0][0]
-        matches.append((career, similarity * 100))
-    matches.sort(key=lambda x: x[1], reverse=True)
-    return matches[:5]
+    user_emb = cached_encode([user_skill_str])[0]
+    _, career_table = _load_careers()
+    if career_table.ann_index is not None:
+        # hnswlib reports inner-product distance as 1 - similarity, nearest first
+        labels, distances = career_table.ann_index.knn_query(user_emb, k=min(5, len(career_table.embedded_ids)))
+        return [(career_table.titles[career_table.embedded_ids[i]], (1.0 - float(d)) * 100)
+                for i, d in zip(labels[0], distances[0])]
+    # Rows and query are L2-normalized, so one matrix-vector product gives every cosine
+    similarities = career_table.embeddings @ user_emb
+    return [(career_table.titles[career_table.embedded_ids[i]], float(similarities[i]) * 100)
+            for i in top_n_indices(similarities, 5)]
 
 def gap_analysis(user_skills, target_career):
     """Identify missing skills for a target career."""
+    careers, _ = _load_careers()
     if target_career not in careers:
         raise ValueError(f"Career '{target_career}' not found")
     required = set(careers[target_career]['skills'])
@@ -112,19 +273,22 @@ def analyze_resume(pdf_path, target_career):
     if not os.path.exists(pdf_path):
         raise FileNotFoundError("PDF file not found")
     with pdfplumber.open(pdf_path) as pdf:
-        text = ' '.join(page.extract_text() for page in pdf.pages if page.extract_text())
-    doc = nlp(text)
-    extracted_skills = [ent.text for ent in doc.ents if ent.label_ in ['ORG', 'PRODUCT']]
-    match_percent = (len(set(extracted_skills) & set(careers[target_career]['skills'])) /
-                    len(careers[target_career]['skills']) * 100 if careers[target_career]['skills'] else 0)
+        # Extract each page once (the filter used to run a second full extraction)
+        text = ' '.join(filter(None, (page.extract_text() for page in pdf.pages)))
+    extracted_skills = find_known_skills(text)
+    _, career_table = _load_careers()
+    required = career_table.skill_sets[career_table.ids[target_career]]
+    match_percent = len(required.intersection(extracted_skills)) / len(required) * 100 if required else 0
     suggestions = gap_analysis(extracted_skills, target_career)
     return extracted_skills, match_percent, suggestions
 
+@functools.lru_cache(maxsize=1024)
 def chatbot_query(user_query):
-    """Answer career-related questions using FAQ embeddings."""
-    query_emb = model.encode(user_query)
-    similarities = util.cosine_similarity(query_emb.reshape(1, -1), faq_embeddings)[0]
-    best_idx = np.argmax(similarities)
+    """Answer career-related questions using FAQ embeddings (repeated queries skip encoding)."""
+    query_emb = cached_encode([user_query])[0]
+    # FAQ embeddings are normalized at build time, so a dot product is the cosine
+    similarities = _load_faq_embeddings() @ query_emb
+    best_idx = int(np.argmax(similarities))
     if similarities[best_idx] > 0.5:
         return faq[best_idx]['answer']
     return "Sorry, I don't have an answer for that. Try rephrasing!"
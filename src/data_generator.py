@@ -1,580 +1,518 @@
 import pandas as pd
+import numpy as np
+import os
 import json
-import random
-from typing import List, Dict, Any
+import functools
+from typing import List, Dict, Any, Callable, Iterator, Sequence, Tuple
 
-class CareerDataGenerator:
-    def __init__(self):
-        self.careers = [
-            "Data Scientist", "Data Engineer", "Machine Learning Engineer", 
-            "Software Engineer", "Frontend Developer", "Backend Developer",
-            "DevOps Engineer", "Product Manager", "UX Designer", "Data Analyst",
-            "Business Analyst", "Cloud Architect", "Cybersecurity Analyst",
-            "AI Research Scientist", "Full Stack Developer", "Mobile Developer",
-            "QA Engineer", "Technical Writer", "Data Architect", "MLOps Engineer"
-        ]
-        
-        self.skills = [
-            # Programming Languages
-            "Python", "Java", "JavaScript", "SQL", "C++", "C#", "Go", "Rust", 
-            "Scala", "Kotlin", "Swift", "PHP", "Ruby", "R", "MATLAB", "Julia",
-            
-            # Data Science & ML
-            "Machine Learning", "Deep Learning", "Statistics", "Data Science",
-            "Data Visualization", "Data Analysis", "Data Cleaning", "Feature Engineering",
-            "Model Evaluation", "A/B Testing", "Business Intelligence",
-            
-            # ML/AI Frameworks
-            "TensorFlow", "PyTorch", "Scikit-learn", "Keras", "XGBoost", "LightGBM",
-            
-            # Data Tools
-            "Pandas", "NumPy", "Matplotlib", "Seaborn", "Plotly", "Jupyter",
-            "Anaconda", "Tableau", "Power BI", "Looker", "Qlik", "SAS", "SPSS",
-            
-            # Web Development
-            "HTML", "CSS", "React", "Angular", "Vue.js", "Node.js", "TypeScript",
-            "Flask", "Django", "FastAPI", "Spring Boot", "Express.js",
-            
-            # Databases
-            "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "Oracle",
-            "SQL Server", "Cassandra", "DynamoDB", "Neo4j",
-            
-            # Cloud & DevOps
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "Ansible",
-            "Jenkins", "GitLab CI", "GitHub Actions", "CI/CD", "DevOps",
-            
-            # Big Data
-            "Hadoop", "Spark", "Kafka", "Hive", "Pig", "Storm", "Flink",
-            
-            # Tools & Platforms
-            "Git", "Linux", "Shell Scripting", "Bash", "PowerShell", "JIRA",
-            "Confluence", "Agile", "Scrum", "Kanban",
-            
-            # Design & UX
-            "Figma", "Adobe XD", "Sketch", "InVision", "Principle", "Protopie",
-            "User Research", "Prototyping", "Usability Testing", "Design Systems",
-            
-            # Testing
-            "Selenium", "JUnit", "Pytest", "Cypress", "Postman", "Swagger",
-            "API Testing", "Performance Testing", "Security Testing",
-            
-            # Security
-            "Cybersecurity", "Network Security", "Application Security", "Incident Response",
-            "Threat Intelligence", "Vulnerability Assessment", "Penetration Testing",
-            
-            # Business & Management
-            "Product Management", "Business Analysis", "Project Management",
-            "Stakeholder Management", "Requirements Gathering", "Process Improvement",
-            "Change Management", "Risk Assessment", "Cost-Benefit Analysis",
-            
-            # Communication & Documentation
-            "Technical Writing", "Documentation", "Markdown", "Content Strategy",
-            "Knowledge Management", "Training", "Presentation Skills",
-            
-            # Specialized Skills
-            "Computer Vision", "NLP", "Reinforcement Learning", "MLOps",
-            "Data Engineering", "ETL", "Data Warehousing", "Data Governance",
-            "Microservices", "API Design", "System Design", "Distributed Systems",
-            "Mobile Development", "Game Development", "Blockchain", "IoT"
-        ]
-        
-        self.platforms = ["Coursera", "edX", "Udemy", "DataCamp", "Pluralsight", 
-                         "LinkedIn Learning", "MIT OpenCourseWare", "Stanford Online"]
-        
-        self.countries = ["United States", "United Kingdom", "Germany", "Canada", 
-                         "Australia", "Netherlands", "Sweden", "Switzerland", 
-                         "Singapore", "Japan", "India", "Brazil", "France", "Spain"]
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib encoder writes the same JSON, only slower
+    orjson = None
+
+# Generator methods whose DataFrame is built once per instance and then reused
+CACHED_DATASET_METHODS = (
+    "generate_career_skills_mapping", "generate_salary_demand_data", "generate_courses_data",
+    "generate_job_posts_data", "generate_peer_profiles_data", "generate_career_keywords_data"
+)
+
+def _memoize_frame(method: Callable[[], pd.DataFrame]) -> Callable[[], pd.DataFrame]:
+    """Cache a generator method's DataFrame; callers get a copy so the cached frame stays intact"""
+    cached = functools.lru_cache(maxsize=1)(method)
     
-    def generate_career_skills_mapping(self) -> pd.DataFrame:
-        """Generate mapping of careers to required skills with difficulty levels"""
-        data = []
-        
-        career_skill_mapping = {
-            "Data Scientist": [
-                "Python", "SQL", "Machine Learning", "Statistics", "Data Visualization", 
-                "Pandas", "NumPy", "Scikit-learn", "Jupyter", "Matplotlib", "Seaborn", 
-                "Plotly", "R", "TensorFlow", "PyTorch", "Deep Learning", "Data Cleaning",
-                "Feature Engineering", "Model Evaluation", "A/B Testing", "Business Intelligence"
-            ],
-            "Data Engineer": [
-                "Python", "SQL", "Hadoop", "Spark", "Kafka", "Docker", "AWS", "Data Architecture",
-                "ETL", "Data Warehousing", "Data Modeling", "NoSQL", "PostgreSQL", "MongoDB", 
-                "Redis", "Elasticsearch", "Kubernetes", "Terraform", "CI/CD", "Data Governance",
-                "Data Quality", "Streaming Data", "Big Data", "Cloud Platforms", "Linux"
-            ],
-            "Machine Learning Engineer": [
-                "Python", "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", 
-                "MLOps", "Docker", "Kubernetes", "Scikit-learn", "NumPy", "Pandas", 
-                "Jupyter", "Statistics", "Mathematics", "Linear Algebra", "Calculus",
-                "Probability", "Optimization", "Neural Networks", "Computer Vision", 
-                "NLP", "Model Deployment", "MLOps Tools", "Cloud ML", "Monitoring"
-            ],
-            "Software Engineer": [
-                "Java", "Python", "JavaScript", "Git", "Data Structures", "Algorithms", 
-                "SQL", "Docker", "REST APIs", "Microservices", "Design Patterns", 
-                "Object-Oriented Programming", "Functional Programming", "Testing", 
-                "CI/CD", "Agile", "Scrum", "Code Review", "Performance Optimization",
-                "Security", "Database Design", "System Design", "Distributed Systems"
-            ],
-            "Frontend Developer": [
-                "HTML", "CSS", "JavaScript", "React", "TypeScript", "Responsive Design", 
-                "Git", "Web APIs", "Angular", "Vue.js", "SASS", "LESS", "Webpack", 
-                "Babel", "ES6+", "DOM Manipulation", "AJAX", "REST APIs", "GraphQL",
-                "Progressive Web Apps", "Accessibility", "Performance", "Testing", "SEO"
-            ],
-            "Backend Developer": [
-                "Python", "Java", "Node.js", "SQL", "REST APIs", "Microservices", 
-                "Docker", "Cloud Platforms", "Flask", "Django", "Spring Boot", 
-                "Express.js", "Database Design", "Authentication", "Authorization",
-                "API Design", "Caching", "Message Queues", "WebSockets", "GraphQL",
-                "Testing", "Performance", "Security", "Monitoring", "Logging"
-            ],
-            "DevOps Engineer": [
-                "Docker", "Kubernetes", "AWS", "Jenkins", "Terraform", "Linux", 
-                "Shell Scripting", "CI/CD", "Azure", "GCP", "Ansible", "Chef", 
-                "Puppet", "GitLab CI", "GitHub Actions", "Monitoring", "Logging",
-                "Infrastructure as Code", "Networking", "Security", "Compliance",
-                "Backup", "Disaster Recovery", "Performance Tuning", "Automation"
-            ],
-            "Product Manager": [
-                "Agile", "Scrum", "JIRA", "User Research", "Data Analysis", "SQL", 
-                "Excel", "Product Strategy", "User Stories", "Requirements Gathering",
-                "Stakeholder Management", "Market Research", "Competitive Analysis",
-                "Product Roadmap", "A/B Testing", "Analytics", "User Experience",
-                "Business Model", "Go-to-Market Strategy", "Customer Development",
-                "Metrics", "KPIs", "Product Launch", "Customer Success"
-            ],
-            "UX Designer": [
-                "Figma", "Adobe XD", "User Research", "Prototyping", "Usability Testing", 
-                "Design Systems", "HTML", "CSS", "Sketch", "InVision", "Principle",
-                "User Interviews", "Surveys", "Personas", "User Journey Maps",
-                "Wireframing", "Information Architecture", "Interaction Design",
-                "Visual Design", "Typography", "Color Theory", "Accessibility",
-                "Design Thinking", "Human-Centered Design", "A/B Testing"
-            ],
-            "Data Analyst": [
-                "SQL", "Excel", "Python", "Tableau", "Power BI", "Statistics", 
-                "Data Cleaning", "Data Visualization", "Pandas", "NumPy", "R",
-                "Business Intelligence", "Data Storytelling", "Dashboard Design",
-                "KPI Tracking", "Trend Analysis", "Forecasting", "Hypothesis Testing",
-                "Correlation Analysis", "Regression", "Data Quality", "ETL"
-            ],
-            "Business Analyst": [
-                "SQL", "Excel", "Business Process", "Requirements Gathering", 
-                "Stakeholder Management", "Data Analysis", "JIRA", "Business Process Modeling",
-                "Process Improvement", "Change Management", "Risk Assessment",
-                "Cost-Benefit Analysis", "ROI Analysis", "Business Rules", "Use Cases",
-                "User Stories", "Workflow Design", "Documentation", "Training",
-                "Business Intelligence", "Reporting", "Analytics"
-            ],
-            "Cloud Architect": [
-                "AWS", "Azure", "GCP", "Terraform", "Docker", "Kubernetes", 
-                "Networking", "Security", "Cloud Computing", "Microservices",
-                "Serverless", "Containerization", "Infrastructure as Code",
-                "Cloud Security", "Compliance", "Cost Optimization", "Performance",
-                "Scalability", "High Availability", "Disaster Recovery", "Monitoring",
-                "Logging", "Backup", "Migration", "Multi-Cloud Strategy"
-            ],
-            "Cybersecurity Analyst": [
-                "Linux", "Networking", "Security Tools", "Incident Response", 
-                "Threat Intelligence", "Python", "SIEM", "Vulnerability Assessment",
-                "Penetration Testing", "Security Monitoring", "Forensics",
-                "Compliance", "Risk Assessment", "Security Policies", "Access Control",
-                "Encryption", "Firewall", "IDS/IPS", "Security Awareness", "Training",
-                "Incident Management", "Threat Hunting", "Malware Analysis"
-            ],
-            "AI Research Scientist": [
-                "Python", "Machine Learning", "Deep Learning", "Mathematics", 
-                "Research Methods", "PyTorch", "TensorFlow", "Linear Algebra",
-                "Calculus", "Probability", "Statistics", "Optimization", "Neural Networks",
-                "Computer Vision", "NLP", "Reinforcement Learning", "Research Design",
-                "Data Collection", "Experimental Design", "Academic Writing", "Publications",
-                "Conference Presentations", "Grant Writing", "Collaboration"
-            ],
-            "Full Stack Developer": [
-                "HTML", "CSS", "JavaScript", "Python", "Java", "SQL", "React", 
-                "Node.js", "Docker", "Full Stack Development", "Web Development",
-                "Frontend", "Backend", "Database Design", "API Development",
-                "Authentication", "Deployment", "DevOps", "Testing", "Performance",
-                "Security", "Responsive Design", "Mobile-First", "Progressive Web Apps"
-            ],
-            "Mobile Developer": [
-                "Swift", "Kotlin", "React Native", "Flutter", "Mobile UI/UX", 
-                "Git", "APIs", "App Store", "iOS Development", "Android Development",
-                "Mobile App Design", "Performance", "Testing", "Debugging",
-                "App Store Optimization", "Push Notifications", "Offline Support",
-                "Mobile Security", "Cross-Platform Development", "Native Development"
-            ],
-            "QA Engineer": [
-                "Testing Tools", "Python", "Selenium", "JIRA", "Test Automation", 
-                "SQL", "API Testing", "Performance Testing", "Manual Testing",
-                "Test Planning", "Test Cases", "Bug Tracking", "Regression Testing",
-                "User Acceptance Testing", "Load Testing", "Security Testing",
-                "Mobile Testing", "Web Testing", "Database Testing", "Test Reports"
-            ],
-            "Technical Writer": [
-                "Technical Writing", "Markdown", "Git", "Documentation Tools", 
-                "Subject Matter Expertise", "Editing", "Research", "Content Strategy",
-                "Information Architecture", "User Documentation", "API Documentation",
-                "User Guides", "Tutorials", "Knowledge Management", "Content Management",
-                "Localization", "Translation", "Style Guides", "Documentation Standards"
-            ],
-            "Data Architect": [
-                "Data Modeling", "SQL", "NoSQL", "Data Governance", "ETL", 
-                "Data Warehousing", "Cloud Platforms", "Architecture", "Data Strategy",
-                "Data Quality", "Data Security", "Data Privacy", "Master Data Management",
-                "Data Integration", "Data Migration", "Data Catalog", "Metadata Management",
-                "Data Lineage", "Data Architecture Patterns", "Enterprise Architecture"
-            ],
-            "MLOps Engineer": [
-                "Machine Learning", "Docker", "Kubernetes", "CI/CD", "Monitoring", 
-                "Python", "MLOps Tools", "Cloud Platforms", "Model Deployment",
-                "Model Versioning", "Model Monitoring", "A/B Testing", "Feature Stores",
-                "Data Pipelines", "ML Infrastructure", "Model Registry", "MLOps Best Practices",
-                "Performance Monitoring", "Alerting", "Incident Response", "Automation"
-            ]
-        }
-        
-        # Define skill categories and their weights
-        skill_categories = {
-            "core": 1.0,           # Core skills (highest weight)
-            "intermediate": 0.7,    # Intermediate skills (medium weight)  
-            "supporting": 0.4,      # Supporting tools (lower weight)
-            "soft": 0.6             # Soft skills (moderate weight)
+    @functools.wraps(method)
+    def wrapper() -> pd.DataFrame:
+        return cached().copy()
+    
+    return wrapper
+
+# Resume keywords per career type; a career gets the keywords of the first type its title contains
+RESUME_KEYWORDS = {
+    "Data": ("data analysis", "data visualization", "statistics", "machine learning", "python", "sql"),
+    "Engineer": ("software development", "programming", "algorithms", "data structures", "git", "testing"),
+    "Designer": ("user experience", "user interface", "prototyping", "wireframing", "design systems"),
+    "Manager": ("project management", "team leadership", "stakeholder management", "agile", "scrum"),
+    "Analyst": ("business analysis", "requirements gathering", "process improvement", "data analysis")
+}
+
+# Generic keywords added for every career
+GENERIC_RESUME_KEYWORDS = ("problem solving", "communication", "collaboration", "time management", "leadership")
+
+def _write_json(path: str, data: Any) -> None:
+    """Write data as 2-space indented JSON, encoded with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def _sequential_ids(prefix: str, size: int) -> np.ndarray:
+    """Unique, sortable ids PREFIX_0001, PREFIX_0002, ... built as one numpy string array"""
+    return np.char.add(f"{prefix}_", np.char.zfill(np.arange(1, size + 1).astype(str), 4))
+
+def _join_codes(codes: np.ndarray, counts: np.ndarray, vocabulary: Sequence[str]) -> List[str]:
+    """Serialize per-row codes (first counts[i] codes of row i) as comma-joined names"""
+    return [", ".join([vocabulary[code] for code in row[:count]]) for row, count in zip(codes.tolist(), counts.tolist())]
+
+def _category_dtype(values) -> pd.CategoricalDtype:
+    """Categorical dtype over a fixed vocabulary (duplicates dropped, order kept)"""
+    return _cached_category_dtype(tuple(values))
+
+@functools.lru_cache(maxsize=32)
+def _cached_category_dtype(values: Tuple[str, ...]) -> pd.CategoricalDtype:
+    """Build each vocabulary's dtype once; pandas validates the categories on every construction"""
+    return pd.CategoricalDtype(list(dict.fromkeys(values)))
+
+# Skill taxonomy files shipped next to this module; edit them to change the taxonomy without code changes
+TAXONOMY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy")
+
+@functools.lru_cache(maxsize=1)
+def load_skills() -> Tuple[str, ...]:
+    """Technical skill vocabulary from taxonomy/skills.txt (one skill per line, # comments),
+    read on first use; generate_career_skills_mapping adds SOFT_SKILLS per instance"""
+    with open(os.path.join(TAXONOMY_DIR, "skills.txt"), encoding="utf-8") as f:
+        return tuple(line.strip() for line in f if line.strip() and not line.lstrip().startswith("#"))
+
+@functools.lru_cache(maxsize=1)
+def load_career_skill_mapping() -> Dict[str, Tuple[str, ...]]:
+    """Skills each career requires, from taxonomy/career_skills.json, read on first use"""
+    with open(os.path.join(TAXONOMY_DIR, "career_skills.json"), encoding="utf-8") as f:
+        return {career: tuple(skills) for career, skills in json.load(f).items()}
+
+# Careers covered by every generated dataset (static data is built once at import and shared)
+CAREERS = (
+    "Data Scientist", "Data Engineer", "Machine Learning Engineer", 
+    "Software Engineer", "Frontend Developer", "Backend Developer",
+    "DevOps Engineer", "Product Manager", "UX Designer", "Data Analyst",
+    "Business Analyst", "Cloud Architect", "Cybersecurity Analyst",
+    "AI Research Scientist", "Full Stack Developer", "Mobile Developer",
+    "QA Engineer", "Technical Writer", "Data Architect", "MLOps Engineer"
+)
+
+# Course platforms
+PLATFORMS = ("Coursera", "edX", "Udemy", "DataCamp", "Pluralsight", 
+             "LinkedIn Learning", "MIT OpenCourseWare", "Stanford Online")
+
+# Hiring and peer locations
+COUNTRIES = ("United States", "United Kingdom", "Germany", "Canada", 
+             "Australia", "Netherlands", "Sweden", "Switzerland", 
+             "Singapore", "Japan", "India", "Brazil", "France", "Spain")
+
+# Define skill categories and their weights
+SKILL_CATEGORIES = {
+    "core": 1.0,           # Core skills (highest weight)
+    "intermediate": 0.7,    # Intermediate skills (medium weight)  
+    "supporting": 0.4,      # Supporting tools (lower weight)
+    "soft": 0.6             # Soft skills (moderate weight)
+}
+
+# Categorize skills by importance (unlisted skills are "intermediate")
+SKILL_CATEGORY_MAPPING = {
+    # Core Skills (High Weight)
+    "Python": "core", "SQL": "core", "Machine Learning": "core", "Deep Learning": "core",
+    "Statistics": "core", "Data Science": "core", "Java": "core", "JavaScript": "core",
+    "Data Modeling": "core", "ETL": "core", "Data Architecture": "core", "MLOps": "core",
+    "Computer Vision": "core", "NLP": "core", "Neural Networks": "core", "TensorFlow": "core",
+    "PyTorch": "core", "Scikit-learn": "core", "Data Engineering": "core", "Big Data": "core",
+    
+    # Intermediate Skills (Medium Weight)
+    "Pandas": "intermediate", "NumPy": "intermediate", "Matplotlib": "intermediate", 
+    "Seaborn": "intermediate", "Plotly": "intermediate", "Hadoop": "intermediate",
+    "Spark": "intermediate", "Kafka": "intermediate", "Docker": "intermediate",
+    "Kubernetes": "intermediate", "AWS": "intermediate", "Azure": "intermediate",
+    "React": "intermediate", "Angular": "intermediate", "Node.js": "intermediate",
+    "Flask": "intermediate", "Django": "intermediate", "Spring Boot": "intermediate",
+    
+    # Supporting Tools (Lower Weight)
+    "Tableau": "supporting", "Power BI": "supporting", "Excel": "supporting",
+    "Jupyter": "supporting", "Git": "supporting", "JIRA": "supporting",
+    "Figma": "supporting", "Adobe XD": "supporting", "Selenium": "supporting",
+    "Jenkins": "supporting", "Terraform": "supporting", "Ansible": "supporting",
+    
+    # Soft Skills (Moderate Weight)
+    "Communication": "soft", "Problem Solving": "soft", "Teamwork": "soft",
+    "Critical Thinking": "soft", "Leadership": "soft", "Adaptability": "soft",
+    "Time Management": "soft", "Creativity": "soft", "Analytical Thinking": "soft",
+    "Project Management": "soft", "Stakeholder Management": "soft", "Mentoring": "soft"
+}
+
+# Category codes follow SKILL_CATEGORIES order: per-code weights and each listed skill's code
+SKILL_CATEGORY_WEIGHTS = np.array(list(SKILL_CATEGORIES.values()))
+_SKILL_CATEGORY_CODES = {
+    skill: list(SKILL_CATEGORIES).index(skill_category) for skill, skill_category in SKILL_CATEGORY_MAPPING.items()
+}
+_DEFAULT_CATEGORY_CODE = list(SKILL_CATEGORIES).index("intermediate")
+
+# Soft skills added to the skills list
+SOFT_SKILLS = (
+    "Communication", "Problem Solving", "Teamwork", "Critical Thinking", 
+    "Leadership", "Adaptability", "Time Management", "Creativity", 
+    "Analytical Thinking", "Project Management", "Stakeholder Management", 
+    "Mentoring", "Negotiation", "Presentation Skills", "Active Listening",
+    "Conflict Resolution", "Strategic Thinking", "Innovation", "Collaboration"
+)
+
+# Course title templates
+COURSE_TEMPLATES = (
+    "Complete {skill} Course for {level}",
+    "{skill} Masterclass: From {level} to Advanced",
+    "Learn {skill} - {level} Tutorial",
+    "{skill} Fundamentals for {level}",
+    "Advanced {skill} Techniques",
+    "{skill} Bootcamp: {level} Edition"
+)
+
+# Course prices (float32 is plenty for display prices)
+COURSE_PRICES = np.array([0.0, 9.99, 19.99, 29.99, 49.99, 99.99], dtype=np.float32)
+
+# Hiring companies
+COMPANIES = (
+    "TechCorp", "DataFlow Inc", "InnovateTech", "FutureSystems", "CloudWorks",
+    "AILabs", "Digital Solutions", "TechStart", "Enterprise Corp", "StartupXYZ",
+    "BigTech Company", "Innovation Hub", "Tech Giants", "Digital Future", "Smart Solutions"
+)
+
+# Job title templates
+JOB_TITLES = (
+    "Senior {career}", "Junior {career}", "{career} Lead", "Principal {career}",
+    "Staff {career}", "Associate {career}", "Senior {career} II", "{career} Manager"
+)
+
+# Chatbot Q&A pairs, built once at import
+QA_PAIRS = (
+    {
+        "question": "Which career suits me if I love AI?",
+        "answer": "If you're passionate about AI, consider these careers: Data Scientist, Machine Learning Engineer, AI Research Scientist, or MLOps Engineer. These roles involve working with AI algorithms, neural networks, and machine learning models.",
+        "category": "Career Guidance",
+        "tags": ("AI", "career choice", "machine learning")
+    },
+    {
+        "question": "How do I start to become a Software Engineer?",
+        "answer": "To become a Software Engineer: 1) Learn programming fundamentals (Python/Java), 2) Study data structures and algorithms, 3) Build projects and contribute to open source, 4) Learn version control (Git), 5) Practice coding interviews, 6) Get internships or entry-level positions.",
+        "category": "Learning Path",
+        "tags": ("software engineering", "learning path", "programming")
+    },
+    {
+        "question": "What skills do I need for Data Science?",
+        "answer": "Essential skills for Data Science: Python, SQL, Statistics, Machine Learning, Data Visualization (Tableau/Power BI), Pandas/NumPy, and domain knowledge. Also important: critical thinking, communication, and business acumen.",
+        "category": "Skills",
+        "tags": ("data science", "skills", "requirements")
+    },
+    {
+        "question": "Is a degree necessary for tech careers?",
+        "answer": "While a degree can be helpful, many tech careers value skills and experience over formal education. Bootcamps, online courses, and self-study can be effective alternatives. Focus on building a strong portfolio and gaining practical experience.",
+        "category": "Education",
+        "tags": ("education", "degree", "bootcamp", "self-study")
+    },
+    {
+        "question": "How much can I earn as a Data Engineer?",
+        "answer": "Data Engineer salaries vary by location and experience: Entry-level: $60K-80K, Mid-level: $80K-120K, Senior: $120K-180K+. High demand in tech hubs like San Francisco, New York, and London.",
+        "category": "Salary",
+        "tags": ("data engineering", "salary", "compensation")
+    },
+    {
+        "question": "What's the difference between Data Scientist and Data Analyst?",
+        "answer": "Data Analysts focus on descriptive analytics, creating reports and dashboards. Data Scientists do predictive analytics, build ML models, and work on complex algorithms. Data Scientists typically need more advanced statistical and programming skills.",
+        "category": "Career Comparison",
+        "tags": ("data scientist", "data analyst", "differences")
+    },
+    {
+        "question": "How do I transition from non-tech to tech?",
+        "answer": "Transitioning to tech: 1) Identify transferable skills, 2) Learn programming fundamentals, 3) Build projects in your target area, 4) Network with tech professionals, 5) Consider bootcamps or certifications, 6) Start with entry-level positions.",
+        "category": "Career Transition",
+        "tags": ("career change", "transition", "non-tech to tech")
+    },
+    {
+        "question": "What programming language should I learn first?",
+        "answer": "Python is excellent for beginners due to readable syntax and versatility. It's used in data science, web development, AI, and automation. JavaScript is great if you're interested in web development. Start with one and master the fundamentals.",
+        "category": "Programming",
+        "tags": ("programming", "python", "javascript", "first language")
+    }
+)
+
+class CareerDataGenerator:
+    def __init__(self, seed: int = 42):
+        # Static data is shared; skills is copied because generate_career_skills_mapping extends it
+        self.careers = CAREERS
+        self.skills = list(load_skills())
+        self.platforms = PLATFORMS
+        self.countries = COUNTRIES
+        
+        # O(1) membership tests against the skills list
+        self._skill_set = frozenset(self.skills)
+        
+        # Codes (indices into self.skills) of the listed skills each career requires, built once
+        # so job postings can sample career-relevant skills
+        skill_codes = {}
+        for code, skill in enumerate(self.skills):
+            skill_codes.setdefault(skill, code)
+        self._career_skill_idx = {
+            career: np.array([skill_codes[skill] for skill in skills if skill in skill_codes], dtype=np.intp)
+            for career, skills in load_career_skill_mapping().items()
         }
         
-        # Categorize skills by importance
-        skill_category_mapping = {
-            # Core Skills (High Weight)
-            "Python": "core", "SQL": "core", "Machine Learning": "core", "Deep Learning": "core",
-            "Statistics": "core", "Data Science": "core", "Java": "core", "JavaScript": "core",
-            "Data Modeling": "core", "ETL": "core", "Data Architecture": "core", "MLOps": "core",
-            "Computer Vision": "core", "NLP": "core", "Neural Networks": "core", "TensorFlow": "core",
-            "PyTorch": "core", "Scikit-learn": "core", "Data Engineering": "core", "Big Data": "core",
-            
-            # Intermediate Skills (Medium Weight)
-            "Pandas": "intermediate", "NumPy": "intermediate", "Matplotlib": "intermediate", 
-            "Seaborn": "intermediate", "Plotly": "intermediate", "Hadoop": "intermediate",
-            "Spark": "intermediate", "Kafka": "intermediate", "Docker": "intermediate",
-            "Kubernetes": "intermediate", "AWS": "intermediate", "Azure": "intermediate",
-            "React": "intermediate", "Angular": "intermediate", "Node.js": "intermediate",
-            "Flask": "intermediate", "Django": "intermediate", "Spring Boot": "intermediate",
-            
-            # Supporting Tools (Lower Weight)
-            "Tableau": "supporting", "Power BI": "supporting", "Excel": "supporting",
-            "Jupyter": "supporting", "Git": "supporting", "JIRA": "supporting",
-            "Figma": "supporting", "Adobe XD": "supporting", "Selenium": "supporting",
-            "Jenkins": "supporting", "Terraform": "supporting", "Ansible": "supporting",
-            
-            # Soft Skills (Moderate Weight)
-            "Communication": "soft", "Problem Solving": "soft", "Teamwork": "soft",
-            "Critical Thinking": "soft", "Leadership": "soft", "Adaptability": "soft",
-            "Time Management": "soft", "Creativity": "soft", "Analytical Thinking": "soft",
-            "Project Management": "soft", "Stakeholder Management": "soft", "Mentoring": "soft"
-        }
+        # One seeded numpy Generator (PCG64) for all randomness, so the synthetic data is
+        # reproducible and every column is a bulk draw rather than one call per row
+        self.rng = np.random.default_rng(seed)
         
+        # Each dataset is generated once per instance, e.g. when an app regenerates per request
+        for name in CACHED_DATASET_METHODS:
+            setattr(self, name, _memoize_frame(getattr(self, name)))
+    
+    def _draw_categorical(self, values: Sequence[str], size: int) -> pd.Categorical:
+        """Uniform draws from a fixed vocabulary, stored as a categorical"""
+        return pd.Categorical.from_codes(self.rng.integers(0, len(values), size), dtype=_category_dtype(values))
+    
+    def _sample_codes(self, vocabulary_size: int, counts: np.ndarray) -> np.ndarray:
+        """Codes sampled without replacement for every row at once; row i uses its first
+        counts[i] entries (argsorting random keys gives each row a uniform random permutation)"""
+        max_count = int(counts.max()) if len(counts) else 0
+        return np.argsort(self.rng.random((len(counts), vocabulary_size)), axis=1)[:, :max_count]
+    
+    def _draw_dates_2024(self, size: int) -> pd.DatetimeIndex:
+        """Uniform random days in 2024 as datetime64 (written to CSV as YYYY-MM-DD)"""
+        return pd.Timestamp("2024-01-01") + pd.to_timedelta(self.rng.integers(0, 366, size), unit="D")
+    
+    def generate_career_skills_mapping(self) -> pd.DataFrame:
+        """Generate mapping of careers to required skills with difficulty levels"""
         # Add soft skills to the skills list
-        soft_skills = [
-            "Communication", "Problem Solving", "Teamwork", "Critical Thinking", 
-            "Leadership", "Adaptability", "Time Management", "Creativity", 
-            "Analytical Thinking", "Project Management", "Stakeholder Management", 
-            "Mentoring", "Negotiation", "Presentation Skills", "Active Listening",
-            "Conflict Resolution", "Strategic Thinking", "Innovation", "Collaboration"
-        ]
-        self.skills.extend(soft_skills)
+        self.skills.extend(SOFT_SKILLS)
+        self._skill_set = frozenset(self.skills)
         
         difficulty_levels = ["Beginner", "Intermediate", "Advanced"]
-        
-        for career in self.careers:
-            if career in career_skill_mapping:
-                skills = career_skill_mapping[career]
-                for skill in skills:
-                    if skill in self.skills:
-                        # Determine skill category and weight
-                        category = skill_category_mapping.get(skill, "intermediate")
-                        weight = skill_categories[category]
-                        
-                        # Adjust importance based on category
-                        base_importance = random.randint(7, 10)
-                        weighted_importance = int(base_importance * weight)
-                        
-                        data.append({
-                            "career": career,
-                            "skill": skill,
-                            "difficulty": random.choice(difficulty_levels),
-                            "importance": weighted_importance,
-                            "is_required": random.choice([True, False]),
-                            "category": category,
-                            "weight": weight
-                        })
-        
-        return pd.DataFrame(data)
+        career_dtype = _category_dtype(self.careers)
+        skill_dtype = _category_dtype(self.skills)
+        skill_codes = {skill: code for code, skill in enumerate(skill_dtype.categories)}
+        
+        # Collect career, skill and skill category codes for every listed skill; the random
+        # columns are then drawn in one call each
+        career_skill_mapping = load_career_skill_mapping()
+        career_col, skill_col, category_col = [], [], []
+        for career_code, career in enumerate(career_dtype.categories):
+            for skill in career_skill_mapping.get(career, ()):
+                if skill in skill_codes:
+                    career_col.append(career_code)
+                    skill_col.append(skill_codes[skill])
+                    category_col.append(_SKILL_CATEGORY_CODES.get(skill, _DEFAULT_CATEGORY_CODE))
+        num_rows = len(skill_col)
+        category_codes = np.array(category_col, dtype=np.int8)
+        weight = SKILL_CATEGORY_WEIGHTS[category_codes]
+        
+        # Adjust importance based on category
+        base_importance = self.rng.integers(7, 11, num_rows)
+        
+        # Multiply and truncate to int32 in one ufunc pass, without a float64 temporary
+        importance = np.multiply(base_importance, weight, out=np.empty(num_rows, dtype=np.int32),
+                                 casting="unsafe")
+        
+        return pd.DataFrame({
+            "career": pd.Categorical.from_codes(career_col, dtype=career_dtype),
+            "skill": pd.Categorical.from_codes(skill_col, dtype=skill_dtype),
+            "difficulty": self._draw_categorical(difficulty_levels, num_rows),
+            "importance": importance,
+            "is_required": self.rng.integers(0, 2, num_rows, dtype=np.bool_),
+            "category": pd.Categorical.from_codes(category_codes, dtype=_category_dtype(SKILL_CATEGORIES)),
+            "weight": weight.astype(np.float32)
+        })
     
     def generate_salary_demand_data(self) -> pd.DataFrame:
         """Generate salary and demand data for careers"""
-        data = []
+        num_careers = len(self.careers)
         
+        # Generate realistic salary ranges based on career type
+        salary_low, salary_high = [], []
         for career in self.careers:
-            # Generate realistic salary ranges based on career type
             if "Data" in career or "ML" in career or "AI" in career:
-                base_salary = random.randint(80000, 150000)
+                low, high = 80000, 150000
             elif "Engineer" in career or "Developer" in career:
-                base_salary = random.randint(70000, 130000)
+                low, high = 70000, 130000
             elif "Manager" in career or "Architect" in career:
-                base_salary = random.randint(90000, 160000)
+                low, high = 90000, 160000
             else:
-                base_salary = random.randint(60000, 110000)
-            
-            # Add some variation
-            min_salary = int(base_salary * 0.8)
-            max_salary = int(base_salary * 1.3)
-            
-            # Generate demand index (0-100)
-            demand_index = random.randint(60, 95)
-            
-            # Select top hiring countries
-            top_countries = random.sample(self.countries, random.randint(3, 6))
-            
-            data.append({
-                "career": career,
-                "min_salary": min_salary,
-                "max_salary": max_salary,
-                "avg_salary": base_salary,
-                "demand_index": demand_index,
-                "top_countries": ", ".join(top_countries),
-                "growth_rate": random.randint(5, 25),
-                "remote_friendly": random.choice([True, False])
-            })
-        
-        return pd.DataFrame(data)
+                low, high = 60000, 110000
+            salary_low.append(low)
+            salary_high.append(high + 1)
+        base_salary = self.rng.integers(salary_low, salary_high, num_careers, dtype=np.int32)
+        
+        # Select top hiring countries (3-6 per career)
+        country_counts = self.rng.integers(3, 7, num_careers)
+        top_countries = _join_codes(self._sample_codes(len(self.countries), country_counts),
+                                    country_counts, self.countries)
+        
+        return pd.DataFrame({
+            "career": pd.Categorical.from_codes(np.arange(num_careers), dtype=_category_dtype(self.careers)),
+            "min_salary": (base_salary * 0.8).astype(np.int32),
+            "max_salary": (base_salary * 1.3).astype(np.int32),
+            "avg_salary": base_salary,
+            "demand_index": self.rng.integers(60, 96, num_careers, dtype=np.int32),  # Demand index (0-100)
+            "top_countries": top_countries,
+            "growth_rate": self.rng.integers(5, 26, num_careers, dtype=np.int32),
+            "remote_friendly": self.rng.integers(0, 2, num_careers, dtype=np.bool_)
+        })
     
     def generate_courses_data(self) -> pd.DataFrame:
         """Generate synthetic online courses data"""
-        data = []
-        
-        course_templates = [
-            "Complete {skill} Course for {level}",
-            "{skill} Masterclass: From {level} to Advanced",
-            "Learn {skill} - {level} Tutorial",
-            "{skill} Fundamentals for {level}",
-            "Advanced {skill} Techniques",
-            "{skill} Bootcamp: {level} Edition"
-        ]
-        
+        return pd.concat(self.generate_courses_data_iter(), ignore_index=True)
+    
+    def generate_courses_data_iter(self, chunk_size: int = 1000) -> Iterator[pd.DataFrame]:
+        """Generate the courses data as DataFrames of at most chunk_size rows, so a sink can
+        write each chunk without the full table ever being in memory"""
         levels = ["Beginner", "Intermediate", "Advanced"]
-        
-        for skill in self.skills[:30]:  # Limit to first 30 skills for variety
-            for level in levels:
-                for _ in range(random.randint(1, 3)):  # 1-3 courses per skill-level combination
-                    course_title = random.choice(course_templates).format(skill=skill, level=level)
-                    
-                    # Generate realistic course data
-                    duration_hours = random.randint(2, 20)
-                    rating = round(random.uniform(3.5, 5.0), 1)
-                    price = random.choice([0, 9.99, 19.99, 29.99, 49.99, 99.99])
-                    
-                    data.append({
-                        "title": course_title,
-                        "skill": skill,
-                        "level": level,
-                        "platform": random.choice(self.platforms),
-                        "duration_hours": duration_hours,
-                        "rating": rating,
-                        "price": price,
-                        "students_enrolled": random.randint(100, 50000),
-                        "instructor": f"Dr. {random.choice(['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller'])}",
-                        "last_updated": f"2024-{random.randint(1, 12):02d}",
-                        "certificate": random.choice([True, False]),
-                        "url": f"https://example.com/courses/{skill.lower().replace(' ', '-')}-{level.lower()}"
-                    })
-        
-        return pd.DataFrame(data)
+        instructors = [f"Dr. {name}" for name in ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller']]
+        
+        # Limit to first 30 skills for variety; 1-3 courses per skill-level combination
+        pairs = [(skill, level) for skill in self.skills[:30] for level in levels]
+        pair_idx = np.repeat(np.arange(len(pairs)), self.rng.integers(1, 4, len(pairs)))
+        num_courses = len(pair_idx)
+        
+        # Every template formatted once per pair; each course picks one by template index
+        titles = np.array([[template.format(skill=skill, level=level) for template in COURSE_TEMPLATES]
+                           for skill, level in pairs], dtype=object).reshape(len(pairs), len(COURSE_TEMPLATES))
+        pair_skills = np.array([skill for skill, _ in pairs], dtype=object)
+        pair_levels = np.array([level for _, level in pairs], dtype=object)
+        pair_urls = np.array([f"https://example.com/courses/{skill.lower().replace(' ', '-')}-{level.lower()}"
+                              for skill, level in pairs], dtype=object)
+        
+        skill_dtype = _category_dtype(pair_skills)
+        
+        # Draw every random column for all courses once and slice it per chunk, so the
+        # generated rows do not depend on chunk_size
+        title_idx = self.rng.integers(0, len(COURSE_TEMPLATES), num_courses)
+        platforms = self._draw_categorical(self.platforms, num_courses)
+        duration_hours = self.rng.integers(2, 21, num_courses, dtype=np.int32)
+        ratings = (self.rng.integers(35, 51, num_courses, dtype=np.int16) / 10.0).astype(np.float32)
+        prices = self.rng.choice(COURSE_PRICES, num_courses)
+        students_enrolled = self.rng.integers(100, 50001, num_courses, dtype=np.int32)
+        course_instructors = self._draw_categorical(instructors, num_courses)
+        last_updated = pd.period_range("2024-01", periods=12, freq="M")[self.rng.integers(0, 12, num_courses)]
+        certificates = self.rng.integers(0, 2, num_courses, dtype=np.bool_)
+        
+        # Always yield at least one (possibly empty) chunk so callers can concat the result
+        for start in range(0, max(num_courses, 1), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            chunk_idx = pair_idx[chunk]
+            
+            # Generate realistic course data; small fixed vocabularies are stored as categoricals
+            yield pd.DataFrame({
+                "title": titles[chunk_idx, title_idx[chunk]],
+                "skill": pd.Categorical(pair_skills[chunk_idx], dtype=skill_dtype),
+                "level": pd.Categorical(pair_levels[chunk_idx], categories=levels),
+                "platform": platforms[chunk],
+                "duration_hours": duration_hours[chunk],
+                "rating": ratings[chunk],
+                "price": prices[chunk],
+                "students_enrolled": students_enrolled[chunk],
+                "instructor": course_instructors[chunk],
+                "last_updated": last_updated[chunk],
+                "certificate": certificates[chunk],
+                "url": pair_urls[chunk_idx]
+            }, index=pd.RangeIndex(start, start + len(chunk_idx)))
     
     def generate_job_posts_data(self) -> pd.DataFrame:
         """Generate synthetic job postings data"""
-        data = []
-        
-        companies = [
-            "TechCorp", "DataFlow Inc", "InnovateTech", "FutureSystems", "CloudWorks",
-            "AILabs", "Digital Solutions", "TechStart", "Enterprise Corp", "StartupXYZ",
-            "BigTech Company", "Innovation Hub", "Tech Giants", "Digital Future", "Smart Solutions"
-        ]
-        
-        job_titles = [
-            "Senior {career}", "Junior {career}", "{career} Lead", "Principal {career}",
-            "Staff {career}", "Associate {career}", "Senior {career} II", "{career} Manager"
-        ]
-        
-        for career in self.careers:
-            for _ in range(random.randint(3, 8)):  # 3-8 jobs per career
-                job_title = random.choice(job_titles).format(career=career)
-                company = random.choice(companies)
-                
-                # Generate location
-                location = random.choice(self.countries)
-                
-                # Generate salary range
-                base_salary = random.randint(60000, 150000)
-                min_salary = int(base_salary * 0.8)
-                max_salary = int(base_salary * 1.2)
-                
-                # Generate required skills
-                required_skills = random.sample(self.skills[:20], random.randint(3, 6))
-                
-                data.append({
-                    "job_id": f"JOB_{random.randint(1000, 9999)}",
-                    "title": job_title,
-                    "company": company,
-                    "location": location,
-                    "min_salary": min_salary,
-                    "max_salary": max_salary,
-                    "required_skills": ", ".join(required_skills),
-                    "experience_level": random.choice(["Entry", "Mid", "Senior", "Lead"]),
-                    "job_type": random.choice(["Full-time", "Contract", "Part-time", "Remote"]),
-                    "posted_date": f"2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
-                    "application_deadline": f"2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
-                    "url": f"https://example.com/jobs/{random.randint(1000, 9999)}"
-                })
-        
-        return pd.DataFrame(data)
+        experience_levels = ["Entry", "Mid", "Senior", "Lead"]
+        job_types = ["Full-time", "Contract", "Part-time", "Remote"]
+        
+        # 3-8 jobs per career, drawn for all careers at once
+        jobs_per_career = self.rng.integers(3, 9, len(self.careers))
+        career_idx = np.repeat(np.arange(len(self.careers)), jobs_per_career)
+        num_jobs = len(career_idx)
+        
+        # Every title template formatted once per career; each job picks one by index
+        titles = np.array([[title.format(career=career) for title in JOB_TITLES] for career in self.careers],
+                          dtype=object).reshape(len(self.careers), len(JOB_TITLES))
+        
+        # Generate salary range
+        base_salary = self.rng.integers(60000, 150001, num_jobs)
+        
+        # Generate 3-6 required skills per job from the career's own skills (the first 20 skills
+        # for careers without a mapping); names are joined only when the frame is assembled
+        default_skill_idx = np.arange(min(20, len(self.skills)))
+        required_skills = []
+        for career, skill_counts in zip(self.careers, np.split(self.rng.integers(3, 7, num_jobs),
+                                                               np.cumsum(jobs_per_career)[:-1])):
+            eligible_idx = self._career_skill_idx.get(career, default_skill_idx)
+            skill_counts = np.minimum(skill_counts, len(eligible_idx))
+            skill_codes = eligible_idx[self._sample_codes(len(eligible_idx), skill_counts)]
+            required_skills.extend(_join_codes(skill_codes, skill_counts, self.skills))
+        
+        return pd.DataFrame({
+            "job_id": _sequential_ids("JOB", num_jobs),
+            "title": titles[career_idx, self.rng.integers(0, len(JOB_TITLES), num_jobs)],
+            "company": self._draw_categorical(COMPANIES, num_jobs),
+            "location": self._draw_categorical(self.countries, num_jobs),
+            "min_salary": (base_salary * 0.8).astype(np.int32),
+            "max_salary": (base_salary * 1.2).astype(np.int32),
+            "required_skills": required_skills,
+            "experience_level": self._draw_categorical(experience_levels, num_jobs),
+            "job_type": self._draw_categorical(job_types, num_jobs),
+            "posted_date": self._draw_dates_2024(num_jobs),
+            "application_deadline": self._draw_dates_2024(num_jobs),
+            "url": np.char.add("https://example.com/jobs/", np.arange(1, num_jobs + 1).astype(str))
+        })
     
     def generate_peer_profiles_data(self) -> pd.DataFrame:
         """Generate synthetic peer profiles for benchmarking"""
-        data = []
-        
-        for career in self.careers:
-            for _ in range(random.randint(5, 15)):  # 5-15 peers per career
-                # Generate skills for this peer
-                num_skills = random.randint(5, 12)
-                peer_skills = random.sample(self.skills, num_skills)
-                
-                # Generate experience level
-                experience_years = random.randint(1, 15)
-                
-                # Generate education
-                education = random.choice(["Bachelor's", "Master's", "PhD", "Bootcamp", "Self-taught"])
-                
-                # Generate location
-                location = random.choice(self.countries)
-                
-                # Generate salary (within career range)
-                base_salary = random.randint(50000, 120000)
-                
-                data.append({
-                    "profile_id": f"PROF_{random.randint(1000, 9999)}",
-                    "career": career,
-                    "skills": ", ".join(peer_skills),
-                    "experience_years": experience_years,
-                    "education": education,
-                    "location": location,
-                    "salary": base_salary,
-                    "company_size": random.choice(["Startup", "Mid-size", "Enterprise", "FAANG"]),
-                    "certifications": random.randint(0, 5),
-                    "projects_completed": random.randint(1, 20),
-                    "github_stars": random.randint(0, 100),
-                    "linkedin_connections": random.randint(50, 1000)
-                })
-        
-        return pd.DataFrame(data)
+        education_levels = ["Bachelor's", "Master's", "PhD", "Bootcamp", "Self-taught"]
+        company_sizes = ["Startup", "Mid-size", "Enterprise", "FAANG"]
+        
+        # 5-15 peers per career, drawn for all careers at once
+        peers_per_career = self.rng.integers(5, 16, len(self.careers))
+        num_peers = int(peers_per_career.sum())
+        
+        # Generate skills for each peer as codes into the skills list
+        peer_skill_counts = self.rng.integers(5, 13, num_peers)
+        peer_skill_codes = self._sample_codes(len(self.skills), peer_skill_counts)
+        
+        return pd.DataFrame({
+            "profile_id": _sequential_ids("PROF", num_peers),
+            "career": pd.Categorical.from_codes(np.repeat(np.arange(len(self.careers)), peers_per_career),
+                                                dtype=_category_dtype(self.careers)),
+            "skills": _join_codes(peer_skill_codes, peer_skill_counts, self.skills),
+            "experience_years": self.rng.integers(1, 16, num_peers, dtype=np.int32),
+            "education": self._draw_categorical(education_levels, num_peers),
+            "location": self._draw_categorical(self.countries, num_peers),
+            "salary": self.rng.integers(50000, 120001, num_peers, dtype=np.int32),  # Within career range
+            "company_size": self._draw_categorical(company_sizes, num_peers),
+            "certifications": self.rng.integers(0, 6, num_peers, dtype=np.int32),
+            "projects_completed": self.rng.integers(1, 21, num_peers, dtype=np.int32),
+            "github_stars": self.rng.integers(0, 101, num_peers, dtype=np.int32),
+            "linkedin_connections": self.rng.integers(50, 1001, num_peers, dtype=np.int32)
+        })
     
     def generate_career_keywords_data(self) -> pd.DataFrame:
         """Generate keywords and skill-frequency data for resume analysis"""
-        data = []
-        
-        for career in self.careers:
-            # Generate keywords commonly found in resumes for this career
-            keywords = []
-            
-            if "Data" in career:
-                keywords.extend(["data analysis", "data visualization", "statistics", "machine learning", "python", "sql"])
-            elif "Engineer" in career:
-                keywords.extend(["software development", "programming", "algorithms", "data structures", "git", "testing"])
-            elif "Designer" in career:
-                keywords.extend(["user experience", "user interface", "prototyping", "wireframing", "design systems"])
-            elif "Manager" in career:
-                keywords.extend(["project management", "team leadership", "stakeholder management", "agile", "scrum"])
-            elif "Analyst" in career:
-                keywords.extend(["business analysis", "requirements gathering", "process improvement", "data analysis"])
-            
-            # Add some generic keywords
-            keywords.extend(["problem solving", "communication", "collaboration", "time management", "leadership"])
-            
-            # Generate frequency scores
-            for keyword in keywords:
-                frequency = random.randint(60, 95)  # 60-95% frequency
-                importance = random.randint(7, 10)  # 7-10 importance score
-                
-                data.append({
-                    "career": career,
-                    "keyword": keyword,
-                    "frequency_percentage": frequency,
-                    "importance_score": importance,
-                    "category": random.choice(["Technical", "Soft Skills", "Tools", "Methodologies"])
-                })
-        
-        return pd.DataFrame(data)
+        keyword_categories = ["Technical", "Soft Skills", "Tools", "Methodologies"]
+        
+        # Keywords commonly found in resumes: the first matching career type's keywords
+        # (in RESUME_KEYWORDS order) plus the generic ones
+        career_col, keyword_col = [], []
+        for career_code, career in enumerate(self.careers):
+            keywords = next((keywords for career_type, keywords in RESUME_KEYWORDS.items() if career_type in career), ())
+            keywords += GENERIC_RESUME_KEYWORDS
+            career_col.extend([career_code] * len(keywords))
+            keyword_col.extend(keywords)
+        num_rows = len(keyword_col)
+        
+        return pd.DataFrame({
+            "career": pd.Categorical.from_codes(career_col, dtype=_category_dtype(self.careers)),
+            "keyword": keyword_col,
+            "frequency_percentage": self.rng.integers(60, 96, num_rows, dtype=np.int32),  # 60-95% frequency
+            "importance_score": self.rng.integers(7, 11, num_rows, dtype=np.int32),  # 7-10 importance score
+            "category": self._draw_categorical(keyword_categories, num_rows)
+        })
     
     def generate_qa_dataset(self) -> List[Dict[str, Any]]:
         """Generate Q&A dataset for the chatbot"""
-        qa_data = [
-            {
-                "question": "Which career suits me if I love AI?",
-                "answer": "If you're passionate about AI, consider these careers: Data Scientist, Machine Learning Engineer, AI Research Scientist, or MLOps Engineer. These roles involve working with AI algorithms, neural networks, and machine learning models.",
-                "category": "Career Guidance",
-                "tags": ["AI", "career choice", "machine learning"]
-            },
-            {
-                "question": "How do I start to become a Software Engineer?",
-                "answer": "To become a Software Engineer: 1) Learn programming fundamentals (Python/Java), 2) Study data structures and algorithms, 3) Build projects and contribute to open source, 4) Learn version control (Git), 5) Practice coding interviews, 6) Get internships or entry-level positions.",
-                "category": "Learning Path",
-                "tags": ["software engineering", "learning path", "programming"]
-            },
-            {
-                "question": "What skills do I need for Data Science?",
-                "answer": "Essential skills for Data Science: Python, SQL, Statistics, Machine Learning, Data Visualization (Tableau/Power BI), Pandas/NumPy, and domain knowledge. Also important: critical thinking, communication, and business acumen.",
-                "category": "Skills",
-                "tags": ["data science", "skills", "requirements"]
-            },
-            {
-                "question": "Is a degree necessary for tech careers?",
-                "answer": "While a degree can be helpful, many tech careers value skills and experience over formal education. Bootcamps, online courses, and self-study can be effective alternatives. Focus on building a strong portfolio and gaining practical experience.",
-                "category": "Education",
-                "tags": ["education", "degree", "bootcamp", "self-study"]
-            },
-            {
-                "question": "How much can I earn as a Data Engineer?",
-                "answer": "Data Engineer salaries vary by location and experience: Entry-level: $60K-80K, Mid-level: $80K-120K, Senior: $120K-180K+. High demand in tech hubs like San Francisco, New York, and London.",
-                "category": "Salary",
-                "tags": ["data engineering", "salary", "compensation"]
-            },
-            {
-                "question": "What's the difference between Data Scientist and Data Analyst?",
-                "answer": "Data Analysts focus on descriptive analytics, creating reports and dashboards. Data Scientists do predictive analytics, build ML models, and work on complex algorithms. Data Scientists typically need more advanced statistical and programming skills.",
-                "category": "Career Comparison",
-                "tags": ["data scientist", "data analyst", "differences"]
-            },
-            {
-                "question": "How do I transition from non-tech to tech?",
-                "answer": "Transitioning to tech: 1) Identify transferable skills, 2) Learn programming fundamentals, 3) Build projects in your target area, 4) Network with tech professionals, 5) Consider bootcamps or certifications, 6) Start with entry-level positions.",
-                "category": "Career Transition",
-                "tags": ["career change", "transition", "non-tech to tech"]
-            },
-            {
-                "question": "What programming language should I learn first?",
-                "answer": "Python is excellent for beginners due to readable syntax and versatility. It's used in data science, web development, AI, and automation. JavaScript is great if you're interested in web development. Start with one and master the fundamentals.",
-                "category": "Programming",
-                "tags": ["programming", "python", "javascript", "first language"]
-            }
-        ]
-        
-        return qa_data
+        # Fresh dicts and tag lists per call so callers cannot modify the shared pairs
+        return [{**qa, "tags": list(qa["tags"])} for qa in QA_PAIRS]
     
     def generate_all_datasets(self):
         """Generate all datasets and save them"""
         print("Generating synthetic datasets...")
         
         # Create data directory if it doesn't exist
-        import os
         os.makedirs("data", exist_ok=True)
         
         # Generate and save all datasets
@@ -596,8 +534,7 @@ class CareerDataGenerator:
         # Save Q&A dataset as JSON
         qa_data = self.generate_qa_dataset()
         qa_path = "data/qa_dataset.json"
-        with open(qa_path, 'w') as f:
-            json.dump(qa_data, f, indent=2)
+        _write_json(qa_path, qa_data)
         print(f"Saved {qa_path} with {len(qa_data)} Q&A pairs")
         
         # Create a summary dataset info file
@@ -609,8 +546,7 @@ class CareerDataGenerator:
         }
         
         summary_path = "data/dataset_summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        _write_json(summary_path, summary)
         print(f"Saved {summary_path}")
         
         print("\nAll datasets generated successfully!")
@@ -2,17 +2,21 @@
 Enhanced Peer Benchmarking with accurate statistics and career-specific filtering
 """
 
+import copy
+import heapq
 import pandas as pd
 import numpy as np
-from collections import Counter, defaultdict
+from collections import defaultdict
+from itertools import chain
 from typing import List, Dict, Any
-import random
 
 
 class EnhancedPeerBenchmarking:
-    def __init__(self, career_skills_df, peer_profiles_df=None):
+    def __init__(self, career_skills_df, peer_profiles_df=None, seed: int = 42):
         self.career_skills_df = career_skills_df
-        self.peer_profiles_df = peer_profiles_df
+        
+        # Seeded numpy Generator for generated peers, so they are reproducible and drawn in bulk
+        self.rng = np.random.default_rng(seed)
         
         # Career-specific skill mappings
         self.career_skill_mappings = {
@@ -42,14 +46,92 @@ class EnhancedPeerBenchmarking:
             }
         }
         
+        # Lowercase views of the mappings, built once: the set of each tier's skills and a
+        # lowercase -> display name lookup (in mapping order) for reporting missing skills
+        self._normalized_mappings = {
+            career: {tier: frozenset(skill.lower() for skill in skills) for tier, skills in tiers.items()}
+            for career, tiers in self.career_skill_mappings.items()
+        }
+        self._display_skills = {
+            career: {tier: {skill.lower(): skill for skill in skills} for tier, skills in tiers.items()}
+            for career, tiers in self.career_skill_mappings.items()
+        }
+        
         # Generate realistic peer data if not provided
-        if self.peer_profiles_df is None or self.peer_profiles_df.empty:
-            self.peer_profiles_df = self._generate_realistic_peer_data()
+        if peer_profiles_df is None or peer_profiles_df.empty:
+            self._set_peer_store(self._generate_realistic_peer_data())
+        else:
+            self.set_peer_profiles_df(peer_profiles_df)
+    
+    @property
+    def peer_profiles_df(self):
+        """Peer profiles as a DataFrame; generated peers are only converted when asked for"""
+        if self._peer_profiles_df is None and self._peer_store:
+            self._peer_profiles_df = self._peer_store_to_frame()
+        return self._peer_profiles_df
+    
+    @peer_profiles_df.setter
+    def peer_profiles_df(self, peer_profiles_df):
+        self.set_peer_profiles_df(peer_profiles_df)
+    
+    def set_peer_profiles_df(self, peer_profiles_df):
+        """Replace the peer profiles and drop the per-career data derived from the old ones"""
+        self._set_peer_store(self._build_peer_store(peer_profiles_df), peer_profiles_df)
+    
+    def _set_peer_store(self, peer_store, peer_profiles_df=None):
+        self._peer_store = peer_store
+        self._peer_profiles_df = peer_profiles_df
+        self._career_cache = {}
+    
+    def _build_peer_store(self, peer_profiles_df):
+        """Clean peer profiles once and split them by career into parallel columns
+        (experience, salary, education, each peer's stripped skill tokens and skill count)"""
+        if peer_profiles_df is None or peer_profiles_df.empty:
+            return {}
+        
+        # Remove duplicates and invalid salaries; only the columns used below are gathered,
+        # rather than copying every column of the filtered frame
+        keep = (~peer_profiles_df.duplicated() & (peer_profiles_df['salary'] > 0)).to_numpy()
+        careers = peer_profiles_df['career'][keep]
+        skills_column = peer_profiles_df['skills'][keep]
+        
+        experience_years = peer_profiles_df['experience_years'].to_numpy()[keep]
+        salaries = peer_profiles_df['salary'].to_numpy()[keep]
+        educations = peer_profiles_df['education'].to_numpy(dtype=object)[keep]
+        skill_tokens = [
+            [s.strip() for s in str(skills).split(',')] if pd.notna(skills) else []
+            for skills in skills_column
+        ]
+        # Always calculate skill counts to ensure consistency: one regex match per non-blank token
+        skill_counts = skills_column.fillna('').astype(str).str.count(r'(?:^|,)\s*[^,\s]').to_numpy()
+        return {
+            career: {
+                'experience_years': experience_years[rows],
+                'salary': salaries[rows],
+                'education': educations[rows].tolist(),
+                'skill_tokens': [skill_tokens[row] for row in rows],
+                'skill_count': skill_counts[rows]
+            }
+            # observed=True: categories without peers get no entry, so they report "no peer data"
+            for career, rows in careers.groupby(careers, sort=False, observed=True).indices.items()
+        }
+    
+    def _peer_store_to_frame(self):
+        """Flatten the peer store back into one peer profiles DataFrame"""
+        return pd.DataFrame({
+            'career': [career for career, peers in self._peer_store.items() for _ in peers['skill_tokens']],
+            'experience_years': np.concatenate([peers['experience_years'] for peers in self._peer_store.values()]),
+            'salary': np.concatenate([peers['salary'] for peers in self._peer_store.values()]),
+            'education': list(chain.from_iterable(peers['education'] for peers in self._peer_store.values())),
+            'skills': [', '.join(tokens) for peers in self._peer_store.values() for tokens in peers['skill_tokens']],
+            'skill_count': np.concatenate([peers['skill_count'] for peers in self._peer_store.values()])
+        })
     
     def _generate_realistic_peer_data(self):
-        """Generate realistic peer profiles for different careers"""
+        """Generate realistic peer profiles for different careers, as a peer store
+        (see _build_peer_store) rather than a DataFrame"""
         careers = list(self.career_skill_mappings.keys())
-        peer_data = []
+        peer_data = {}
         
         # Generate 50-100 peers per career
         for career in careers:
@@ -59,69 +141,72 @@ class EnhancedPeerBenchmarking:
                                skills_mapping['emerging'] + 
                                skills_mapping['soft'])
             
-            num_peers = random.randint(50, 100)
+            num_peers = int(self.rng.integers(50, 101))
+            career_peers = {'experience_years': [], 'salary': [], 'education': [], 'skill_tokens': []}
+            seen_peers = set()
             
-            for i in range(num_peers):
-                # Generate realistic experience (0-15 years, weighted toward 3-8 years)
-                experience = max(0, int(np.random.normal(5.5, 2.5)))
-                experience = min(experience, 15)
-                
-                # Generate salary based on experience and career
-                base_salary = {
-                    'Data Scientist': 95000,
-                    'Machine Learning Engineer': 110000,
-                    'Data Analyst': 70000,
-                    'Software Engineer': 85000
-                }.get(career, 80000)
-                
-                # Salary increases with experience
-                salary = base_salary + (experience * 8000) + random.randint(-15000, 25000)
-                salary = max(salary, 45000)  # Minimum salary
-                
-                # Generate skills based on experience level
-                peer_skills = []
-                
+            # Generate realistic experience (0-15 years, weighted toward 3-8 years) for all peers
+            experience_years = np.clip(self.rng.normal(5.5, 2.5, num_peers).astype(int), 0, 15)
+            
+            # Generate skills based on experience level: one probability per peer and skill
+            # (columns follow all_career_skills), compared against one matrix of uniform draws
+            tier_sizes = [len(skills_mapping[tier]) for tier in ('core', 'intermediate', 'emerging', 'soft')]
+            skill_probabilities = np.column_stack([
                 # Core skills (high probability)
-                for skill in skills_mapping['core']:
-                    if random.random() < 0.85:  # 85% chance
-                        peer_skills.append(skill)
-                
+                np.full(num_peers, 0.85),
                 # Intermediate skills (medium probability, higher with experience)
-                for skill in skills_mapping['intermediate']:
-                    prob = 0.4 + (experience * 0.05)  # Increases with experience
-                    if random.random() < min(prob, 0.9):
-                        peer_skills.append(skill)
-                
+                np.minimum(0.4 + experience_years * 0.05, 0.9),
                 # Emerging skills (lower probability, much higher with experience)
-                for skill in skills_mapping['emerging']:
-                    prob = 0.1 + (experience * 0.08)  # Strongly increases with experience
-                    if random.random() < min(prob, 0.8):
-                        peer_skills.append(skill)
-                
+                np.minimum(0.1 + experience_years * 0.08, 0.8),
                 # Soft skills (medium probability)
-                for skill in skills_mapping['soft']:
-                    if random.random() < 0.6:
-                        peer_skills.append(skill)
+                np.full(num_peers, 0.6)
+            ]).repeat(tier_sizes, axis=1)
+            has_skill = self.rng.random((num_peers, len(all_career_skills))) < skill_probabilities
+            career_skill_names = np.array(all_career_skills, dtype=object)
+            
+            # Generate salary based on experience and career
+            base_salary = {
+                'Data Scientist': 95000,
+                'Machine Learning Engineer': 110000,
+                'Data Analyst': 70000,
+                'Software Engineer': 85000
+            }.get(career, 80000)
+            
+            # Salary increases with experience (noise for all peers in one draw)
+            salaries = base_salary + (experience_years * 8000) + self.rng.integers(-15000, 25001, num_peers)
+            salaries = np.maximum(salaries, 45000)  # Minimum salary
+            
+            education_options = ['Bachelor\'s', 'Master\'s', 'PhD', 'Bootcamp', 'Self-taught']
+            education_weights = [0.4, 0.35, 0.15, 0.08, 0.02]
+            educations = self.rng.choice(education_options, size=num_peers, p=education_weights)
+            
+            for experience, salary, education, peer_has_skill in zip(
+                experience_years.tolist(), salaries.tolist(), educations, has_skill
+            ):
+                peer_skills = career_skill_names[peer_has_skill].tolist()
                 
                 # Ensure minimum skills
                 if len(peer_skills) < 5:
                     missing_core = [s for s in skills_mapping['core'] if s not in peer_skills]
                     peer_skills.extend(missing_core[:3])
                 
-                education_options = ['Bachelor\'s', 'Master\'s', 'PhD', 'Bootcamp', 'Self-taught']
-                education_weights = [0.4, 0.35, 0.15, 0.08, 0.02]
-                education = np.random.choice(education_options, p=education_weights)
+                # Skip exact duplicate profiles
+                peer_key = (experience, salary, education, tuple(peer_skills))
+                if peer_key in seen_peers:
+                    continue
+                seen_peers.add(peer_key)
                 
-                peer_data.append({
-                    'career': career,
-                    'experience_years': experience,
-                    'salary': salary,
-                    'education': education,
-                    'skills': ', '.join(peer_skills),
-                    'skill_count': len(peer_skills)
-                })
-        
-        return pd.DataFrame(peer_data)
+                career_peers['experience_years'].append(experience)
+                career_peers['salary'].append(salary)
+                career_peers['education'].append(education)
+                career_peers['skill_tokens'].append(peer_skills)
+            
+            career_peers['experience_years'] = np.array(career_peers['experience_years'])
+            career_peers['salary'] = np.array(career_peers['salary'])
+            career_peers['skill_count'] = np.array([len(skills) for skills in career_peers['skill_tokens']])
+            peer_data[career] = career_peers
+        
+        return peer_data
     
     def analyze_peer_benchmarking(self, user_skills: List[str], target_career: str) -> Dict[str, Any]:
         """Enhanced peer benchmarking with accurate statistics and insights"""
@@ -130,69 +215,26 @@ class EnhancedPeerBenchmarking:
         user_skills_normalized = [skill.strip().lower() for skill in user_skills]
         user_skill_set = set(user_skills_normalized)
         
-        # Filter peers by target career
-        career_peers = self.peer_profiles_df[
-            self.peer_profiles_df['career'] == target_career
-        ].copy()
-        
-        if career_peers.empty:
+        # Peer data for the target career is prepared once and reused across calls
+        bundle = self._get_career_bundle(target_career)
+        if bundle is None:
             return {"error": f"No peer data available for {target_career}"}
         
-        # Remove duplicates and clean data
-        career_peers = career_peers.drop_duplicates()
-        career_peers = career_peers[career_peers['salary'] > 0]  # Remove invalid salaries
+        num_peers = len(bundle['peer_tokens'])
+        peer_stats = copy.deepcopy(bundle['peer_stats'])
+        most_common_skills = list(bundle['most_common_skills'])
         
-        # Always calculate skill counts to ensure consistency
-        career_peers = career_peers.copy()
-        career_peers['skill_count'] = career_peers['skills'].apply(
-            lambda x: len([s.strip() for s in str(x).split(',') if s.strip()]) if pd.notna(x) else 0
-        )
-        
-        # Calculate accurate statistics
-        peer_stats = {
-            'avg_experience_years': round(career_peers['experience_years'].mean(), 1),
-            'avg_salary': int(career_peers['salary'].mean()),
-            'avg_skill_count': round(career_peers['skill_count'].mean(), 1),
-            'total_peers': len(career_peers),
-            'salary_range': {
-                'min': int(career_peers['salary'].min()),
-                'max': int(career_peers['salary'].max()),
-                'median': int(career_peers['salary'].median())
-            }
-        }
-        
-        # Analyze skills across all peers
-        all_peer_skills = []
-        peer_skill_analysis = []
-        
-        for _, peer in career_peers.iterrows():
-            peer_skills_raw = [s.strip() for s in peer['skills'].split(',')]
-            peer_skills_normalized = [s.lower() for s in peer_skills_raw]
-            peer_skill_set = set(peer_skills_normalized)
-            
-            # Calculate skill overlap
-            skill_overlap_count = len(user_skill_set.intersection(peer_skill_set))
-            skill_overlap_percentage = (skill_overlap_count / max(len(peer_skill_set), 1)) * 100
-            
-            peer_skill_analysis.append({
-                'experience_years': peer['experience_years'],
-                'salary': peer['salary'],
-                'education': peer['education'],
-                'skill_count': len(peer_skills_raw),
-                'skill_overlap_count': skill_overlap_count,
-                'skill_overlap_percentage': round(skill_overlap_percentage, 1),
-                'skills': peer_skills_raw,
-                'matched_skills': [s for s in peer_skills_raw if s.lower() in user_skill_set]
-            })
-            
-            all_peer_skills.extend(peer_skills_normalized)
-        
-        # Find most common skills
-        skill_frequency = Counter(all_peer_skills)
-        most_common_skills = skill_frequency.most_common(15)
+        # Calculate skill overlap over each peer's distinct normalized skills
+        skill_overlap_counts = np.bincount(
+            bundle['distinct_peer'], weights=bundle['distinct_skill'].isin(user_skill_set), minlength=num_peers
+        ).astype(int)
+        skill_overlap_percentages = [
+            round(percentage, 1)
+            for percentage in (skill_overlap_counts / np.maximum(bundle['peer_skill_set_sizes'], 1) * 100).tolist()
+        ]
         
         # Calculate user's skill coverage
-        peer_skill_set = set(all_peer_skills)
+        peer_skill_set = bundle['peer_skill_set']
         user_coverage = len(user_skill_set.intersection(peer_skill_set))
         total_peer_skills = len(peer_skill_set)
         coverage_percentage = (user_coverage / max(total_peer_skills, 1)) * 100
@@ -202,21 +244,31 @@ class EnhancedPeerBenchmarking:
             user_skills_normalized, target_career, most_common_skills
         )
         
-        # Get top peer profiles (sorted by skill overlap)
-        top_peer_profiles = sorted(
-            peer_skill_analysis, 
-            key=lambda x: x['skill_overlap_percentage'], 
-            reverse=True
-        )[:5]
+        # Get top peer profiles (highest skill overlap, ties keep peer order); only these get records
+        top_positions = heapq.nlargest(5, range(num_peers), key=skill_overlap_percentages.__getitem__)
+        peer_tokens = bundle['peer_tokens']
+        top_peer_profiles = []
+        for position in top_positions:
+            peer_skills_raw = list(peer_tokens[position])
+            top_peer_profiles.append({
+                'experience_years': bundle['peer_experience_years'][position],
+                'salary': bundle['peer_salaries'][position],
+                'education': bundle['peer_educations'][position],
+                'skill_count': len(peer_skills_raw),
+                'skill_overlap_count': int(skill_overlap_counts[position]),
+                'skill_overlap_percentage': skill_overlap_percentages[position],
+                'skills': peer_skills_raw,
+                'matched_skills': [s for s in peer_skills_raw if s.lower() in user_skill_set]
+            })
         
         # Calculate peer comparison metrics
         user_experience = self._estimate_user_experience(user_skills, target_career)
         experience_percentile = self._calculate_percentile(
-            user_experience, career_peers['experience_years'].tolist()
+            user_experience, bundle['experience_sorted']
         )
         
         skill_count_percentile = self._calculate_percentile(
-            len(user_skills), career_peers['skill_count'].tolist()
+            len(user_skills), bundle['skill_count_sorted']
         )
         
         return {
@@ -233,41 +285,99 @@ class EnhancedPeerBenchmarking:
             'most_common_skills': most_common_skills,
             'missing_skills': missing_skills,
             'peer_profiles': top_peer_profiles,
-            'skill_distribution': self._analyze_skill_distribution(most_common_skills, user_skill_set)
+            'skill_distribution': self._analyze_skill_distribution(
+                most_common_skills, user_skill_set, bundle['most_common_total']
+            )
         }
     
+    def _get_career_bundle(self, career: str):
+        """Cleaned peers of one career plus everything derived from them that does not depend
+        on the user: statistics, tokenized skills and skill frequencies (None if no peers)"""
+        if career in self._career_cache:
+            return self._career_cache[career]
+        
+        # Peers of the target career (already de-duplicated, with valid salaries)
+        career_peers = self._peer_store.get(career)
+        if career_peers is None:
+            self._career_cache[career] = None
+            return None
+        
+        num_peers = len(career_peers['skill_tokens'])
+        experience_years = career_peers['experience_years']
+        salaries = career_peers['salary']
+        peer_tokens = career_peers['skill_tokens']
+        peer_tokens_lower = [[s.lower() for s in tokens] for tokens in peer_tokens]
+        peer_skill_sets = [frozenset(tokens) for tokens in peer_tokens_lower]
+        
+        skill_counts = career_peers['skill_count']
+        
+        # Calculate accurate statistics
+        peer_stats = {
+            'avg_experience_years': round(np.mean(experience_years), 1),
+            'avg_salary': int(np.mean(salaries)),
+            'avg_skill_count': round(np.mean(skill_counts), 1),
+            'total_peers': num_peers,
+            'salary_range': {
+                'min': int(salaries.min()),
+                'max': int(salaries.max()),
+                'median': int(np.median(salaries))
+            }
+        }
+        
+        all_peer_skills = list(chain.from_iterable(peer_tokens_lower))
+        
+        # Find most common skills: count with np.unique, then order by count with ties in
+        # first-seen order (the order Counter.most_common gives)
+        unique_skills, first_seen, frequencies = np.unique(
+            np.array(all_peer_skills, dtype=object), return_index=True, return_counts=True
+        )
+        top_skills = np.lexsort((first_seen, -frequencies))[:15]
+        peer_skill_set_sizes = np.fromiter(map(len, peer_skill_sets), int, num_peers)
+        
+        bundle = {
+            'peer_stats': peer_stats,
+            'peer_tokens': peer_tokens,
+            # Per-peer profile fields by position, extracted once instead of converting per call
+            'peer_experience_years': experience_years.tolist(),
+            'peer_salaries': salaries.tolist(),
+            'peer_educations': career_peers['education'],
+            # Each peer's distinct normalized skills, as parallel (peer position, skill) arrays
+            'distinct_peer': np.repeat(np.arange(num_peers), peer_skill_set_sizes),
+            'distinct_skill': pd.Series(list(chain.from_iterable(peer_skill_sets)), dtype=object),
+            'peer_skill_set_sizes': peer_skill_set_sizes,
+            'peer_skill_set': set(all_peer_skills),
+            'most_common_skills': list(zip(unique_skills[top_skills].tolist(), frequencies[top_skills].tolist())),
+            'most_common_total': int(frequencies[top_skills].sum()),
+            # Sorted once so percentiles are a binary search
+            'experience_sorted': np.sort(experience_years),
+            'skill_count_sorted': np.sort(skill_counts)
+        }
+        self._career_cache[career] = bundle
+        return bundle
+    
     def _categorize_missing_skills(self, user_skills: List[str], career: str, common_skills: List[tuple]) -> Dict[str, List[str]]:
         """Categorize missing skills into core, intermediate, and emerging"""
         if career not in self.career_skill_mappings:
             return {'core': [], 'intermediate': [], 'emerging': []}
         
-        skill_mapping = self.career_skill_mappings[career]
+        display_skills = self._display_skills[career]
         user_skill_set = set(user_skills)
         
-        # Get top 10 most common skills from peers
-        top_peer_skills = [skill for skill, _ in common_skills[:10]]
+        # Top 10 most common peer skills that the user lacks
+        missing_top_peer_skills = frozenset(skill for skill, _ in common_skills[:10]) - user_skill_set
         
         missing_skills = {
-            'core': [],
-            'intermediate': [],
-            'emerging': []
+            # Core skills the user lacks
+            'core': [skill for lower, skill in display_skills['core'].items() if lower not in user_skill_set],
+            # Intermediate and emerging skills the user lacks that are also common among peers
+            'intermediate': [
+                skill for lower, skill in display_skills['intermediate'].items() if lower in missing_top_peer_skills
+            ],
+            'emerging': [
+                skill for lower, skill in display_skills['emerging'].items() if lower in missing_top_peer_skills
+            ]
         }
         
-        # Check core skills
-        for skill in skill_mapping['core']:
-            if skill.lower() not in user_skill_set:
-                missing_skills['core'].append(skill)
-        
-        # Check intermediate skills that are also common among peers
-        for skill in skill_mapping['intermediate']:
-            if skill.lower() not in user_skill_set and skill.lower() in top_peer_skills:
-                missing_skills['intermediate'].append(skill)
-        
-        # Check emerging skills that are common among experienced peers
-        for skill in skill_mapping['emerging']:
-            if skill.lower() not in user_skill_set and skill.lower() in top_peer_skills:
-                missing_skills['emerging'].append(skill)
-        
         return missing_skills
     
     def _estimate_user_experience(self, user_skills: List[str], career: str) -> int:
@@ -275,35 +385,35 @@ class EnhancedPeerBenchmarking:
         if career not in self.career_skill_mappings:
             return 2
         
-        skill_mapping = self.career_skill_mappings[career]
-        user_skill_set = set([s.lower() for s in user_skills])
+        skill_mapping = self._normalized_mappings[career]
+        user_skill_set = frozenset(s.lower() for s in user_skills)
         
         # Count skills in each category
-        core_count = sum(1 for s in skill_mapping['core'] if s.lower() in user_skill_set)
-        intermediate_count = sum(1 for s in skill_mapping['intermediate'] if s.lower() in user_skill_set)
-        emerging_count = sum(1 for s in skill_mapping['emerging'] if s.lower() in user_skill_set)
+        core_count = len(user_skill_set & skill_mapping['core'])
+        intermediate_count = len(user_skill_set & skill_mapping['intermediate'])
+        emerging_count = len(user_skill_set & skill_mapping['emerging'])
         
         # Estimate experience based on skill distribution
-        base_experience = 1
-        base_experience += core_count * 0.5
-        base_experience += intermediate_count * 0.8
-        base_experience += emerging_count * 1.2
+        base_experience = 1 + core_count * 0.5 + intermediate_count * 0.8 + emerging_count * 1.2
         
         return min(int(base_experience), 12)  # Cap at 12 years
     
-    def _calculate_percentile(self, value: float, data_list: List[float]) -> int:
-        """Calculate percentile of value in data list"""
-        if not data_list:
+    def _calculate_percentile(self, value: float, sorted_data: np.ndarray) -> int:
+        """Calculate percentile of value in an ascending array (share of entries <= value)"""
+        if len(sorted_data) == 0:
             return 50
         
-        sorted_data = sorted(data_list)
-        position = sum(1 for x in sorted_data if x <= value)
+        position = int(np.searchsorted(sorted_data, value, side='right'))
         percentile = (position / len(sorted_data)) * 100
         return int(percentile)
     
-    def _analyze_skill_distribution(self, common_skills: List[tuple], user_skills: set) -> Dict[str, Any]:
-        """Analyze skill distribution for visualization"""
+    def _analyze_skill_distribution(self, common_skills: List[tuple], user_skills: set,
+                                    total_frequency: int = None) -> Dict[str, Any]:
+        """Analyze skill distribution for visualization (total_frequency, the summed frequency of
+        common_skills, is computed here unless the caller has it cached)"""
         top_10_skills = common_skills[:10]
+        if total_frequency is None:
+            total_frequency = sum(freq for _, freq in common_skills)
         
         skill_analysis = []
         for skill, frequency in top_10_skills:
@@ -311,7 +421,7 @@ class EnhancedPeerBenchmarking:
             skill_analysis.append({
                 'skill': skill.title(),
                 'frequency': frequency,
-                'percentage': round((frequency / sum(freq for _, freq in common_skills)) * 100, 1),
+                'percentage': round((frequency / total_frequency) * 100, 1),
                 'user_has': has_skill
             })
         
@@ -0,0 +1,17 @@
+"""
+Ranking helpers shared by the recommendation pipelines
+"""
+
+import numpy as np
+
+
+def top_n_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+    """Indices of the top_n scores, highest first; ties keep their original order"""
+    top_n = min(top_n, len(scores))
+    if top_n <= 0:
+        return np.array([], dtype=int)
+    
+    # O(n) partition to find the cut-off score, then sort only the candidates
+    cutoff = scores[np.argpartition(-scores, top_n - 1)[top_n - 1]]
+    candidates = np.flatnonzero(scores >= cutoff)
+    return candidates[np.argsort(-scores[candidates], kind='stable')][:top_n]
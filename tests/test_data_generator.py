@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic data generator
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pandas as pd
+
+from data_generator import CareerDataGenerator
+
+
+def test_courses_chunks_do_not_change_the_data():
+    """Chunked course generation yields the same rows whatever the chunk size"""
+    full = pd.concat(CareerDataGenerator(seed=7).generate_courses_data_iter(chunk_size=1000), ignore_index=True)
+
+    for chunk_size in (1, 17, 64):
+        chunks = list(CareerDataGenerator(seed=7).generate_courses_data_iter(chunk_size=chunk_size))
+
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), full)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Regression tests for EnhancedPeerBenchmarking
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pandas as pd
+
+from enhanced_peer_benchmarking import EnhancedPeerBenchmarking
+
+
+def test_unused_career_category_reports_no_peer_data():
+    """A categorical career with no peer rows falls back to the "no peer data" error"""
+    peer_profiles_df = pd.DataFrame({
+        'career': pd.Categorical(
+            ['Data Analyst', 'Data Analyst'], categories=['Data Analyst', 'Data Scientist']
+        ),
+        'experience_years': [2, 5],
+        'salary': [70000, 90000],
+        'education': ["Bachelor's", "Master's"],
+        'skills': ['SQL, Excel, Python', 'SQL, Tableau'],
+        'skill_count': [3, 2]
+    })
+    benchmarking = EnhancedPeerBenchmarking(pd.DataFrame(), peer_profiles_df)
+
+    result = benchmarking.analyze_peer_benchmarking(['Python'], 'Data Scientist')
+
+    assert result == {"error": "No peer data available for Data Scientist"}
+    assert 'error' not in benchmarking.analyze_peer_benchmarking(['Python'], 'Data Analyst')
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Regression tests pinning CareerRecommendationPipeline results
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ai_pipeline_simple import CareerRecommendationPipeline
+
+
+def test_synonym_expansion_short_skill():
+    """A short skill pulls in its own group and every group with a name containing it"""
+    pipeline = CareerRecommendationPipeline()
+
+    expanded = pipeline._expand_skills_with_synonyms(["Python"])
+
+    assert expanded == {
+        'python', 'py', 'python3', 'python3.8', 'python3.9', 'python3.10',
+        'flask', 'django', 'fastapi', 'python web framework', 'microframework', 'wsgi',
+        'mvt', 'admin panel', 'orm', 'async', 'api', 'pydantic',
+        'pytest', 'python testing', 'unit testing', 'test framework', 'fixtures'
+    }
+
+
+def test_synonym_expansion_multi_word_skill():
+    """A multi-word skill also matches groups whose names are contained in it"""
+    pipeline = CareerRecommendationPipeline()
+
+    expanded = pipeline._expand_skills_with_synonyms(["Machine Learning"])
+
+    assert expanded == {
+        'machine learning', 'ml', 'ai', 'artificial intelligence', 'deep learning',
+        'neural networks', 'predictive modeling',
+        'scikit-learn', 'sklearn', 'machine learning library', 'ml library', 'scikit',
+        'mlops', 'machine learning operations', 'model deployment', 'model monitoring',
+        'ml infrastructure',
+        # "ng" (Angular) is a substring of "learning"
+        'angular', 'angularjs', 'ng', 'angular 2+', 'angular material'
+    }
+
+
+def test_synonym_expansion_long_skill():
+    """Long free-text skills are expanded by the names they contain"""
+    pipeline = CareerRecommendationPipeline()
+    long_skill = "built etl pipelines with docker " * 100
+
+    expanded = pipeline._expand_skills_with_synonyms([long_skill])
+
+    assert expanded == {
+        long_skill,
+        'etl', 'extract transform load', 'data pipeline', 'data integration', 'data processing',
+        'docker', 'containerization', 'containers', 'dockerfile', 'docker compose',
+        'jenkins', 'ci/cd', 'continuous integration', 'automation', 'pipeline'
+    }
+
+
+def test_resume_overall_fit_rounding():
+    """Overall fit is the 70/30 skill/keyword blend, rounded as NumPy rounds float64 scores"""
+    pipeline = CareerRecommendationPipeline()
+
+    result = pipeline.resume_analysis(
+        "Experienced professional. gcp, ci/cd, seaborn, nlp, tensorflow, vue.js, programming"
+    )
+
+    fits = {fit['career']: fit for fit in result['career_fits']}
+    research = fits['AI Research Scientist']
+    assert (research['skill_match'], research['keyword_fit']) == (86.5, 0.0)
+    # 86.5 * 0.7 is stored just below 60.55: Python's round gives 60.5, NumPy's gives 60.6
+    assert research['overall_fit'] == 60.6
+
+
+def test_resume_overall_fit_rounding_capped_skill_score():
+    """A capped skill score is the int cap, and its fit is rounded as Python rounds floats"""
+    pipeline = CareerRecommendationPipeline()
+
+    result = pipeline.resume_analysis(
+        "Experienced data engineer. python, sql, hadoop, spark, kafka, docker, aws, etl, "
+        "data warehousing, postgresql, mongodb, redis, elasticsearch, kubernetes, terraform, "
+        "ci/cd, data governance, linux, statistics, communication, leadership"
+    )
+
+    fits = {fit['career']: fit for fit in result['career_fits']}
+    engineer = fits['Data Engineer']
+    assert (engineer['skill_match'], engineer['keyword_fit']) == (100, 45.5)
+    assert isinstance(engineer['skill_match'], int)
+    # 100 * 0.7 + 45.5 * 0.3 is stored just above 83.65: Python's round gives 83.7, NumPy's 83.6
+    assert engineer['overall_fit'] == 83.7